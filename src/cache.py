@@ -0,0 +1,373 @@
+"""Persistent translation cache backed by SQLite."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import orjson
+
+from .config import config
+
+if TYPE_CHECKING:
+    from .models.translation_result import TranslationResult
+
+
+@dataclass
+class CachedTranslation:
+    """A translation previously stored in the cache."""
+
+    translation: str
+    provider: str
+    quality: float
+    quality_json: Optional[str] = None  # Full serialized QualityScore, if stored
+
+
+class _Database:
+    """A SQLite connection and its lock, shared by every cache on the same file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.refs = 0
+
+
+# Open databases by resolved path, so caches on one file share a connection
+_databases: Dict[Path, _Database] = {}
+_databases_lock = threading.Lock()
+
+
+class _SQLiteCache:
+    """
+    Base for the SQLite-backed caches: one table keyed by KEY_COLUMN.
+
+    Subclasses name the table and its columns; the connection, schema setup
+    (including adding columns introduced after a database was created),
+    chunked lookups, inserts and closing are shared. Safe to share across
+    threads.
+    """
+
+    TABLE: str
+    KEY_COLUMN: Tuple[str, str]  # (name, SQL type)
+    COLUMNS: Tuple[Tuple[str, str], ...]  # (name, SQL type) of the value columns
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file path (uses config.cache_path if not provided)
+        """
+        self.path = Path(path or config.cache_path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with _databases_lock:
+            key = self.path.resolve()
+            db = _databases.get(key)
+            if db is None:
+                db = _databases[key] = _Database(key)
+            db.refs += 1
+        self._db = db
+
+        key_name, key_type = self.KEY_COLUMN
+        columns = ", ".join(f"{name} {sql_type}" for name, sql_type in self.COLUMNS)
+        with db.lock:
+            db.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.TABLE} "
+                f"({key_name} {key_type} PRIMARY KEY, {columns})"
+            )
+            # Databases created before a column existed get it added
+            existing = {row[1] for row in db.conn.execute(f"PRAGMA table_info({self.TABLE})")}
+            for name, sql_type in self.COLUMNS:
+                if name not in existing:
+                    db.conn.execute(f"ALTER TABLE {self.TABLE} ADD COLUMN {name} {sql_type}")
+            db.conn.commit()
+
+    def _select(self, keys: Iterable[Any]) -> Dict[Any, tuple]:
+        """Look up rows by key, returning {key: value columns} for hits only."""
+        unique_keys = list(set(keys))
+        names = ", ".join(name for name, _ in self.COLUMNS)
+        rows = {}
+
+        # Stay well below SQLite's bound-parameter limit
+        with self._db.lock:
+            for i in range(0, len(unique_keys), 500):
+                chunk = unique_keys[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for row in self._db.conn.execute(
+                    f"SELECT {self.KEY_COLUMN[0]}, {names} FROM {self.TABLE} "
+                    f"WHERE {self.KEY_COLUMN[0]} IN ({placeholders})",
+                    chunk,
+                ):
+                    rows[row[0]] = row[1:]
+
+        return rows
+
+    def _insert(self, rows: Iterable[tuple]) -> None:
+        """Insert or replace rows of (key, *value columns)."""
+        names = ", ".join((self.KEY_COLUMN[0],) + tuple(name for name, _ in self.COLUMNS))
+        placeholders = ",".join("?" * (len(self.COLUMNS) + 1))
+        with self._db.lock:
+            self._db.conn.executemany(
+                f"INSERT OR REPLACE INTO {self.TABLE} ({names}) VALUES ({placeholders})",
+                list(rows),
+            )
+            self._db.conn.commit()
+
+    def close(self) -> None:
+        """Release the database; the connection closes once no cache uses it."""
+        with _databases_lock:
+            if self._db is None:
+                return
+            db, self._db = self._db, None
+            db.refs -= 1
+            if db.refs == 0:
+                del _databases[db.path]
+                with db.lock:
+                    db.conn.close()
+
+
+class TranslationCache(_SQLiteCache):
+    """
+    Caches translations across runs so unchanged strings skip the APIs.
+
+    Entries are keyed by sha1(source text + target language + provider version),
+    so editing a source string or switching models naturally misses the cache.
+    Safe to share across threads.
+    """
+
+    TABLE = "translations"
+    KEY_COLUMN = ("key_hash", "TEXT")
+    COLUMNS = (
+        ("lang", "TEXT"),
+        ("translation", "TEXT"),
+        ("provider", "TEXT"),
+        ("quality", "REAL"),
+        ("ts", "INTEGER"),
+        ("quality_json", "TEXT"),
+    )
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        provider_version: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+    ):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file path (uses config.cache_path if not provided)
+            provider_version: Version tag mixed into every key
+            ttl_seconds: Ignore entries older than this (no expiry if None)
+        """
+        super().__init__(path)
+        self.provider_version = provider_version or config.cache_provider_version
+        self.ttl_seconds = ttl_seconds
+
+    def _hash(self, source: str, target_lang: str) -> str:
+        """Compute the cache key for a source string and language."""
+        content = f"{source}\x00{target_lang}\x00{self.provider_version}"
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    def get_many(
+        self, strings: Dict[Hashable, str], target_lang: str
+    ) -> Dict[Hashable, CachedTranslation]:
+        """
+        Look up cached translations for a batch of strings.
+
+        Args:
+            strings: Dictionary of {key: source_text}; keys are only used to label hits
+            target_lang: Target language code
+
+        Returns:
+            Dictionary of {key: CachedTranslation} for cache hits only
+        """
+        if not strings:
+            return {}
+
+        hashes = {key: self._hash(source, target_lang) for key, source in strings.items()}
+        rows = {}
+        for key_hash, (_, translation, provider, quality, ts, quality_json) in self._select(
+            hashes.values()
+        ).items():
+            if self.ttl_seconds and time.time() - ts > self.ttl_seconds:
+                continue
+            rows[key_hash] = CachedTranslation(translation, provider, quality, quality_json)
+
+        return {key: rows[h] for key, h in hashes.items() if h in rows}
+
+    def put_many(
+        self, entries: Iterable[Tuple[str, str, str, str, float]]
+    ) -> None:
+        """
+        Store translations in the cache.
+
+        Args:
+            entries: Iterable of (source, target_lang, translation, provider, quality)
+        """
+        self._put_rows(
+            (source, lang, translation, provider, quality, None)
+            for source, lang, translation, provider, quality in entries
+        )
+
+    def put_results(self, results: Iterable["TranslationResult"]) -> None:
+        """
+        Store translation results, including their full quality scores.
+
+        Args:
+            results: Successful TranslationResult objects from the API providers
+        """
+        self._put_rows(
+            (
+                r.source, r.target_lang, r.translation, r.provider,
+                r.quality_score.overall, orjson.dumps(asdict(r.quality_score)).decode("utf-8"),
+            )
+            for r in results
+        )
+
+    def _put_rows(self, rows: Iterable[Tuple[str, str, str, str, float, Optional[str]]]) -> None:
+        """Insert (source, lang, translation, provider, quality, quality_json) rows."""
+        now = int(time.time())
+        self._insert(
+            (self._hash(source, lang), lang, translation, provider, quality, now, quality_json)
+            for source, lang, translation, provider, quality, quality_json in rows
+        )
+
+
+class ResponseCache(_SQLiteCache):
+    """
+    Content-addressed cache of raw provider responses, used by the API clients.
+
+    Keys are sha256 digests of every input that affects a response (provider,
+    model, languages, options, glossary, text), so a hit can skip the API call
+    entirely. Bump NAMESPACE when prompt templates change to invalidate old
+    entries. Safe to share across threads (DeepL calls run in worker threads).
+    """
+
+    NAMESPACE = "v1"
+
+    TABLE = "responses"
+    KEY_COLUMN = ("hash", "BLOB")
+    COLUMNS = (("text", "TEXT"), ("detected_lang", "TEXT"), ("created_at", "INTEGER"))
+
+    def key(self, *parts: str) -> bytes:
+        """Compute the cache key for the given request parts."""
+        content = "\x00".join((self.NAMESPACE,) + parts)
+        return hashlib.sha256(content.encode("utf-8")).digest()
+
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, Tuple[str, Optional[str]]]:
+        """
+        Look up cached responses.
+
+        Args:
+            keys: Cache keys from key()
+
+        Returns:
+            Dictionary of {key: (text, detected_lang)} for cache hits only
+        """
+        return {
+            key: (text, detected_lang)
+            for key, (text, detected_lang, _) in self._select(keys).items()
+        }
+
+    def put_many(self, entries: Iterable[Tuple[bytes, str, Optional[str]]]) -> None:
+        """
+        Store responses in the cache.
+
+        Args:
+            entries: Iterable of (key, text, detected_lang)
+        """
+        now = int(time.time())
+        self._insert((key, text, detected_lang, now) for key, text, detected_lang in entries)
+
+
+class ReviewCache(_SQLiteCache):
+    """
+    Caches LLM review results so unchanged translations are not re-reviewed.
+
+    Keys are blake2b digests of (source, translation, target language, model,
+    context), so editing either text, the context given in the prompt, or
+    switching models misses the cache. Bump
+    NAMESPACE when the review prompts change to invalidate old entries. Safe
+    to share across threads.
+    """
+
+    NAMESPACE = "v1"
+
+    TABLE = "reviews"
+    KEY_COLUMN = ("hash", "BLOB")
+    COLUMNS = (("result_json", "TEXT"), ("created_at", "INTEGER"))
+
+    def key(
+        self,
+        source: str,
+        translation: str,
+        target_lang: str,
+        model: str,
+        context: Optional[str] = None,
+    ) -> bytes:
+        """Compute the cache key for a reviewed translation."""
+        content = "\x00".join(
+            (self.NAMESPACE, source, translation, target_lang, model, context or "")
+        )
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=20).digest()
+
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, str]:
+        """
+        Look up cached reviews.
+
+        Args:
+            keys: Cache keys from key()
+
+        Returns:
+            Dictionary of {key: result_json} for cache hits only
+        """
+        return {key: result_json for key, (result_json, _) in self._select(keys).items()}
+
+    def put_many(self, entries: Iterable[Tuple[bytes, str]]) -> None:
+        """
+        Store reviews in the cache.
+
+        Args:
+            entries: Iterable of (key, result_json)
+        """
+        now = int(time.time())
+        self._insert((key, result_json, now) for key, result_json in entries)
+
+
+class LRUMemo:
+    """Small thread-safe in-process LRU memo for repeated identical calls."""
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Create an empty memo.
+
+        Args:
+            maxsize: Maximum number of entries kept (least recently used are evicted)
+        """
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the memoized value for key, or None."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Memoize value for key, evicting the oldest entry when full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
@@ -1,20 +1,31 @@
 """Command-line interface for the localization pipeline."""
 
+import asyncio
 import click
+from collections import Counter
 from pathlib import Path
-from typing import Optional, List
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.table import Table
-from rich.panel import Panel
+from typing import TYPE_CHECKING, Optional, List
 
 from .extraction.xcstrings_parser import XCStringsParser
 from .extraction.xcstrings_writer import XCStringsWriter
-from .translation.translator import HybridTranslator
-from .validation.llm_reviewer import LLMReviewer, ReviewResult
 from .config import config
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from .validation.llm_reviewer import ReviewResult
+
+# Heavy imports (API SDKs, rich widgets) are deferred to the commands that
+# need them so lightweight commands like `stats` start quickly.
+_console_instance: Optional["Console"] = None
+
+
+def _console() -> "Console":
+    """Get the shared rich console, creating it on first use."""
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
+        _console_instance = Console()
+    return _console_instance
 
 
 @click.group()
@@ -65,6 +76,17 @@ def cli():
     default=None,
     help="Limit number of strings to translate (for testing)"
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Ignore the persistent translation cache"
+)
+@click.option(
+    "--concurrency",
+    type=int,
+    default=8,
+    help="Maximum concurrent API requests per language"
+)
 def translate(
     input_path: str,
     output_path: Optional[str],
@@ -73,8 +95,16 @@ def translate(
     dry_run: bool,
     force_gpt4: bool,
     limit: Optional[int],
+    no_cache: bool,
+    concurrency: int,
 ):
     """Translate an .xcstrings file to target languages."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+    from .translation.translator import HybridTranslator
+    from .cache import ResponseCache, TranslationCache
+
+    console = _console()
+
     # Validate config
     errors = config.validate()
     if errors:
@@ -101,50 +131,64 @@ def translate(
     target_langs = [lang.strip() for lang in languages.split(",")]
     console.print(f"[blue]Target languages:[/blue] {', '.join(target_langs)}")
 
-    # Initialize translator
-    translator = HybridTranslator(quality_threshold=quality_threshold)
-
-    # Translate to each language
+    # Work out which strings each language still needs
+    pending = {}
     for lang in target_langs:
-        console.print(f"\n[bold cyan]Translating to {lang.upper()}...[/bold cyan]")
-
-        # Filter strings that need translation for this language
-        strings_to_translate = {}
-        for key, source in all_strings.items():
-            if key in xcstrings.strings:
-                entry = xcstrings.strings[key]
-                if not entry.has_translation(lang):
-                    strings_to_translate[key] = source
+        translated_keys = xcstrings.get_translated_keys(lang)
+        strings_to_translate = {
+            key: source for key, source in all_strings.items()
+            if key not in translated_keys
+        }
 
         if not strings_to_translate:
             console.print(f"  [green]All strings already translated for {lang}[/green]")
             continue
 
-        console.print(f"  [yellow]Strings to translate:[/yellow] {len(strings_to_translate)}")
-
-        # Translate with progress bar
-        results = []
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console,
-        ) as progress:
-            task = progress.add_task(f"Translating to {lang}", total=len(strings_to_translate))
-
-            def update_progress(current, total, key):
-                progress.update(task, completed=current, description=f"[{lang}] {key[:40]}...")
-
-            results, stats = translator.translate_batch(
-                strings=strings_to_translate,
-                target_lang=lang,
-                progress_callback=update_progress if not force_gpt4 else None,
+        console.print(f"  [yellow]Strings to translate ({lang}):[/yellow] {len(strings_to_translate)}")
+        pending[lang] = strings_to_translate
+
+    # Translate all languages concurrently, one progress bar per language
+    outcomes = {}
+    if pending:
+        # Open the persistent translation cache and the clients' response cache
+        cache = None if no_cache else TranslationCache()
+        response_cache = None if no_cache else ResponseCache()
+        try:
+            translator = HybridTranslator(
+                quality_threshold=quality_threshold,
+                cache=response_cache,
+                translation_cache=cache,
             )
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                console=console,
+            ) as progress:
+                callbacks = {
+                    lang: _progress_callback(progress, lang, len(strings))
+                    for lang, strings in pending.items()
+                }
+                outcomes = asyncio.run(
+                    translator.translate_all_targets(
+                        pending,
+                        progress_callbacks=None if force_gpt4 else callbacks,
+                        max_concurrency=concurrency,
+                    )
+                )
+        finally:
+            if cache:
+                cache.close()
+                response_cache.close()
+
+    # Apply results once all languages are done to avoid concurrent mutation
+    for lang, (results, stats) in outcomes.items():
+        console.print(f"\n[bold cyan]Results for {lang.upper()}[/bold cyan]")
 
         # Update xcstrings with translations
         for result in results:
-            if result.success and result.key in xcstrings.strings:
+            if result.success:
                 xcstrings.strings[result.key].set_translation(lang, result.translation, "translated")
 
         # Print statistics
@@ -164,6 +208,16 @@ def translate(
         console.print("\n[yellow]Dry run - no changes saved[/yellow]")
 
 
+def _progress_callback(progress, lang: str, total: int):
+    """Create a progress task for one language and return its update callback."""
+    task = progress.add_task(f"Translating to {lang}", total=total)
+
+    def update_progress(current, total, key):
+        progress.update(task, completed=current, description=f"[{lang}] {key[:40]}...")
+
+    return update_progress
+
+
 @cli.command()
 @click.option(
     "--input", "-i",
@@ -174,6 +228,8 @@ def translate(
 )
 def stats(input_path: str):
     """Show statistics for an .xcstrings file."""
+    from rich.table import Table
+
     parser = XCStringsParser()
     xcstrings = parser.parse(input_path)
 
@@ -188,28 +244,25 @@ def stats(input_path: str):
     # Source language
     table.add_row("Source language", xcstrings.source_language)
 
-    # Translatable strings
-    translatable = xcstrings.get_translatable_strings()
-    table.add_row("Translatable strings", str(len(translatable)))
+    # Translatable strings (counted once, reused for every coverage row)
+    translatable_count = len(xcstrings.get_translatable_strings())
+    table.add_row("Translatable strings", str(translatable_count))
 
     # Languages present
     languages = set()
     for entry in xcstrings.strings.values():
-        languages.update(entry.localizations.keys())
+        languages.update(entry.localizations)
     table.add_row("Languages", ", ".join(sorted(languages)) or "None")
 
-    # Translation coverage by language
+    # Translation coverage by language, read from the per-language translated index
     for lang in sorted(languages):
         if lang == xcstrings.source_language:
             continue
-        translated = sum(
-            1 for entry in xcstrings.strings.values()
-            if entry.has_translation(lang)
-        )
-        coverage = (translated / len(translatable)) * 100 if translatable else 0
-        table.add_row(f"  {lang} coverage", f"{translated}/{len(translatable)} ({coverage:.1f}%)")
+        translated = len(xcstrings.get_translated_keys(lang))
+        coverage = (translated / translatable_count) * 100 if translatable_count else 0
+        table.add_row(f"  {lang} coverage", f"{translated}/{translatable_count} ({coverage:.1f}%)")
 
-    console.print(table)
+    _console().print(table)
 
 
 @cli.command()
@@ -233,6 +286,10 @@ def stats(input_path: str):
 )
 def untranslated(input_path: str, language: str, limit: int):
     """Show untranslated strings for a specific language."""
+    from rich.table import Table
+
+    console = _console()
+
     parser = XCStringsParser()
     xcstrings = parser.parse(input_path)
 
@@ -261,6 +318,8 @@ def untranslated(input_path: str, language: str, limit: int):
 
 def _print_stats(stats, lang: str):
     """Print translation statistics."""
+    from rich.table import Table
+
     table = Table(title=f"Translation Stats for {lang.upper()}")
     table.add_column("Metric", style="cyan")
     table.add_column("Count", justify="right")
@@ -270,16 +329,18 @@ def _print_stats(stats, lang: str):
     table.add_row("Total", str(total), "100%")
     table.add_row("DeepL", str(stats.deepl_count), f"{stats.deepl_count/total*100:.1f}%")
     table.add_row("GPT-4 (fallback)", str(stats.gpt4_count), f"{stats.gpt4_count/total*100:.1f}%")
+    table.add_row("Cached", str(stats.cached_count), f"{stats.cached_count/total*100:.1f}%")
     table.add_row("Failed", str(stats.failed_count), f"{stats.failed_count/total*100:.1f}%")
 
-    console.print(table)
+    _console().print(table)
 
 
 def _print_quality_breakdown(results):
     """Print quality score breakdown."""
-    green = sum(1 for r in results if r.quality_score.category == "green")
-    yellow = sum(1 for r in results if r.quality_score.category == "yellow")
-    red = sum(1 for r in results if r.quality_score.category == "red")
+    from rich.panel import Panel
+
+    categories = Counter(r.quality_score.category for r in results)
+    green, yellow, red = categories["green"], categories["yellow"], categories["red"]
     total = len(results)
 
     panel_content = (
@@ -288,7 +349,7 @@ def _print_quality_breakdown(results):
         f"[red]Red (<80):[/red] {red} ({red/total*100:.1f}%)"
     )
 
-    console.print(Panel(panel_content, title="Quality Breakdown"))
+    _console().print(Panel(panel_content, title="Quality Breakdown"))
 
 
 @cli.command()
@@ -322,12 +383,24 @@ def _print_quality_breakdown(results):
     is_flag=True,
     help="Apply suggested fixes (with confirmation)"
 )
+@click.option(
+    "--batch-mode",
+    is_flag=True,
+    help="Submit reviews via the OpenAI Batch API (half price; cancelled after REVIEW_BATCH_MAX_WAIT_SECONDS, default 1h)"
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Ignore cached review results"
+)
 def verify(
     input_path: str,
     language: str,
     review_all: bool,
     limit: Optional[int],
     fix: bool,
+    batch_mode: bool,
+    no_cache: bool,
 ):
     """Verify translation quality using LLM semantic review.
 
@@ -335,6 +408,12 @@ def verify(
     By default, only reviews translations marked as 'needs_review'.
     Use --all to review all translations.
     """
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+    from .cache import ReviewCache
+    from .validation.llm_reviewer import LLMReviewer
+
+    console = _console()
+
     # Validate config
     if not config.openai_api_key:
         console.print("[red]Error: OPENAI_API_KEY is not set[/red]")
@@ -384,27 +463,33 @@ def verify(
     console.print(f"[cyan]Reviewing {len(translations_to_review)} translations for {language.upper()}...[/cyan]")
 
     # Initialize reviewer
-    reviewer = LLMReviewer()
-
-    # Review with progress
-    results: List[ReviewResult] = []
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task(f"Reviewing {language}", total=len(translations_to_review))
-
-        def update_progress(current, total, key):
-            progress.update(task, completed=current, description=f"[{language}] {key[:40]}...")
-
-        results = reviewer.review_batch(
-            translations=translations_to_review,
-            target_lang=language,
-            progress_callback=update_progress,
-        )
+    review_cache = None if no_cache else ReviewCache()
+    try:
+        reviewer = LLMReviewer(cache=review_cache)
+
+        # Review with progress
+        results: List["ReviewResult"] = []
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task(f"Reviewing {language}", total=len(translations_to_review))
+
+            def update_progress(current, total, key):
+                progress.update(task, completed=current, description=f"[{language}] {key[:40]}...")
+
+            results = reviewer.review_batch(
+                translations=translations_to_review,
+                target_lang=language,
+                progress_callback=update_progress,
+                batch_mode=batch_mode,
+            )
+    finally:
+        if review_cache:
+            review_cache.close()
 
     # Separate results by status
     passed = [r for r in results if r.passed]
@@ -424,14 +509,23 @@ def verify(
         console.print("\n[green]All reviewed translations look good![/green]")
 
 
-def _print_verify_summary(results: List[ReviewResult]):
+def _print_verify_summary(results: List["ReviewResult"]):
     """Print verification summary."""
+    from rich.panel import Panel
+
     total = len(results)
-    passed = sum(1 for r in results if r.passed)
+
+    # Single pass over the results for all three aggregates
+    passed = 0
+    semantic_sum = fluency_sum = 0.0
+    for r in results:
+        passed += r.passed
+        semantic_sum += r.semantic_score
+        fluency_sum += r.fluency_score
     failed = total - passed
 
-    avg_semantic = sum(r.semantic_score for r in results) / total if total else 0
-    avg_fluency = sum(r.fluency_score for r in results) / total if total else 0
+    avg_semantic = semantic_sum / total if total else 0
+    avg_fluency = fluency_sum / total if total else 0
 
     panel_content = (
         f"[bold]Total reviewed:[/bold] {total}\n"
@@ -442,11 +536,15 @@ def _print_verify_summary(results: List[ReviewResult]):
         f"[dim]Avg fluency score:[/dim] {avg_fluency:.1f}"
     )
 
-    console.print(Panel(panel_content, title="Verification Summary"))
+    _console().print(Panel(panel_content, title="Verification Summary"))
 
 
-def _print_issues_table(results: List[ReviewResult]):
+def _print_issues_table(results: List["ReviewResult"]):
     """Print table of translations with issues."""
+    from rich.table import Table
+
+    console = _console()
+
     console.print("\n[bold yellow]Translations needing attention:[/bold yellow]\n")
 
     table = Table(show_header=True)
@@ -472,8 +570,9 @@ def _print_issues_table(results: List[ReviewResult]):
     console.print(table)
 
 
-def _apply_fixes(xcstrings, results: List[ReviewResult], language: str, output_path: str):
+def _apply_fixes(xcstrings, results: List["ReviewResult"], language: str, output_path: str):
     """Apply suggested fixes with confirmation."""
+    console = _console()
     fixable = [r for r in results if r.suggested_fix]
 
     if not fixable:
@@ -502,7 +601,6 @@ def _apply_fixes(xcstrings, results: List[ReviewResult], language: str, output_p
             xcstrings.strings[r.key].set_translation(language, r.suggested_fix, "translated")
 
     # Write output
-    from .extraction.xcstrings_writer import XCStringsWriter
     writer = XCStringsWriter()
     writer.write(xcstrings, output_path)
 
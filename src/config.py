@@ -33,10 +33,53 @@ class Config:
     openai_batch_size: int = 20
     openai_batch_max_tokens: int = 4000
 
+    # Maximum concurrent API sub-batches per translate_batch call
+    max_concurrency: int = field(
+        default_factory=lambda: int(os.getenv("MAX_CONCURRENCY", "8"))
+    )
+
+    # Maximum requests in flight per provider, shared by every language
+    deepl_concurrency: int = field(
+        default_factory=lambda: int(os.getenv("DEEPL_CONCURRENCY", "4"))
+    )
+    openai_concurrency: int = field(
+        default_factory=lambda: int(os.getenv("OPENAI_CONCURRENCY", "2"))
+    )
+
+    # Seconds between DeepL usage syncs; in between, usage is tracked locally
+    usage_ttl_seconds: float = field(
+        default_factory=lambda: float(os.getenv("DEEPL_USAGE_TTL_SECONDS", "60"))
+    )
+
+    # Classify batches at least this large in worker processes (0 disables)
+    classify_process_threshold: int = field(
+        default_factory=lambda: int(os.getenv("CLASSIFY_PROCESS_THRESHOLD", "0"))
+    )
+
+    # Maximum concurrent review requests in review_batch
+    review_concurrency: int = field(
+        default_factory=lambda: int(os.getenv("REVIEW_CONCURRENCY", "8"))
+    )
+    # Translations reviewed per request by review_multi
+    review_batch_size: int = field(
+        default_factory=lambda: int(os.getenv("REVIEW_BATCH_SIZE", "10"))
+    )
+    # Seconds a Batch API review may run before it is cancelled
+    review_batch_max_wait_seconds: float = field(
+        default_factory=lambda: float(os.getenv("REVIEW_BATCH_MAX_WAIT_SECONDS", "3600"))
+    )
+
     # Bulk LLM review settings
     llm_bulk_review_batch_size: int = 250
     llm_bulk_review_max_tokens: int = 8000
 
+    # Translation cache settings
+    cache_path: str = field(
+        default_factory=lambda: os.getenv(
+            "LOCALIZE_CACHE_PATH", "~/.cache/localize/translations.db"
+        )
+    )
+
     # DeepL language mapping
     DEEPL_LANGUAGE_MAP: dict = field(default_factory=lambda: {
         "de": "DE",
@@ -57,6 +100,11 @@ class Config:
         "en": "English",
     })
 
+    @property
+    def cache_provider_version(self) -> str:
+        """Version tag for cached translations; changes when the model does."""
+        return f"deepl+{self.openai_model}"
+
     def validate(self) -> List[str]:
         """Validate configuration and return list of errors."""
         errors = []
@@ -1,9 +1,11 @@
 """Parser for Apple's .xcstrings JSON format (Xcode 15+)."""
 
-import json
-from typing import Dict, Any
+import sys
+from typing import Dict, Any, Iterator, Optional
 from pathlib import Path
 
+import orjson
+
 from ..models.string_entry import StringUnit, Localization, StringEntry, XCStringsFile
 
 
@@ -20,6 +22,88 @@ class XCStringsParser:
         Returns:
             XCStringsFile object containing all parsed data
         """
+        path = self._check_path(file_path)
+
+        # Parse raw bytes directly; orjson handles UTF-8 decoding natively
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+
+        return self._parse_data(data)
+
+    def parse_streaming(self, file_path: str) -> XCStringsFile:
+        """
+        Parse a large .xcstrings file incrementally.
+
+        Entries are decoded one at a time with ijson instead of loading the
+        whole JSON tree first, so peak memory holds a single raw entry on top
+        of the parsed model.
+
+        Args:
+            file_path: Path to the .xcstrings file
+
+        Returns:
+            XCStringsFile object containing all parsed data
+        """
+        header: Dict[str, Any] = {}
+        strings = {entry.key: entry for entry in self._stream_entries(file_path, header)}
+
+        return XCStringsFile(
+            source_language=header.get("sourceLanguage", "en"),
+            strings=strings,
+            version=header.get("version", "1.0"),
+        )
+
+    def iter_entries(self, file_path: str) -> Iterator[StringEntry]:
+        """
+        Lazily yield string entries from an .xcstrings file.
+
+        Useful for single-pass consumers (e.g. counting) that do not need
+        to keep the whole catalog in memory.
+
+        Args:
+            file_path: Path to the .xcstrings file
+
+        Yields:
+            StringEntry objects in file order
+        """
+        return self._stream_entries(file_path, {})
+
+    def _stream_entries(
+        self, file_path: str, header: Dict[str, Any]
+    ) -> Iterator[StringEntry]:
+        """Stream entries from the "strings" object, filling header with top-level scalars."""
+        import ijson
+
+        path = self._check_path(file_path)
+
+        with open(path, "rb") as f:
+            events = ijson.parse(f, use_float=True)
+            for prefix, event, value in events:
+                if prefix in ("sourceLanguage", "version") and event in ("string", "number"):
+                    header[prefix] = value
+                elif prefix == "strings" and event == "map_key":
+                    yield self._parse_string_entry(value, self._build_value(events))
+
+    @staticmethod
+    def _build_value(events: Iterator) -> Optional[Any]:
+        """Consume the events of one JSON value and return it as Python objects."""
+        import ijson
+
+        builder = ijson.ObjectBuilder()
+        depth = 0
+        for _, event, value in events:
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+            if depth == 0:
+                break
+        return builder.value
+
+    @staticmethod
+    def _check_path(file_path: str) -> Path:
+        """Validate that file_path exists and is an .xcstrings file."""
         path = Path(file_path)
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
@@ -27,10 +111,7 @@ class XCStringsParser:
         if not path.suffix == ".xcstrings":
             raise ValueError(f"Expected .xcstrings file, got: {path.suffix}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        return self._parse_data(data)
+        return path
 
     def parse_string(self, content: str) -> XCStringsFile:
         """
@@ -42,7 +123,7 @@ class XCStringsParser:
         Returns:
             XCStringsFile object
         """
-        data = json.loads(content)
+        data = orjson.loads(content)
         return self._parse_data(data)
 
     def _parse_data(self, data: Dict[str, Any]) -> XCStringsFile:
@@ -64,16 +145,24 @@ class XCStringsParser:
         """Parse a single string entry."""
         comment = entry_data.get("comment")
         extraction_state = entry_data.get("extractionState")
+        if extraction_state is not None:
+            extraction_state = sys.intern(extraction_state)
         localizations = {}
 
+        translated_langs = set()
+
         for lang, loc_data in entry_data.get("localizations", {}).items():
-            localizations[lang] = self._parse_localization(loc_data)
+            loc = self._parse_localization(loc_data)
+            localizations[lang] = loc
+            if loc.string_unit is not None and loc.string_unit.value:
+                translated_langs.add(lang)
 
         return StringEntry(
             key=key,
             comment=comment,
             localizations=localizations,
             extraction_state=extraction_state,
+            translated_langs=translated_langs,
         )
 
     def _parse_localization(self, loc_data: Dict[str, Any]) -> Localization:
@@ -85,7 +174,8 @@ class XCStringsParser:
             su = loc_data["stringUnit"]
             string_unit = StringUnit(
                 value=su.get("value", ""),
-                state=su.get("state", "new"),
+                # States repeat across every localization; share one str object
+                state=sys.intern(su.get("state", "new")),
             )
 
         if "variations" in loc_data:
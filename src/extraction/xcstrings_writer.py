@@ -1,9 +1,10 @@
 """Writer for Apple's .xcstrings JSON format (Xcode 15+)."""
 
-import json
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Tuple
 from pathlib import Path
 
+import orjson
+
 from ..models.string_entry import XCStringsFile, StringEntry, Localization
 
 
@@ -14,18 +15,38 @@ class XCStringsWriter:
         """
         Write an XCStringsFile to disk.
 
+        Entries are serialized one at a time straight to the file handle, so
+        the full catalog is never materialized as a single nested dict.
+
         Args:
             xcstrings: The XCStringsFile to write
             output_path: Path to write the file to
         """
-        data = self._to_dict(xcstrings)
-
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write("\n")  # Trailing newline
+        with open(path, "wb") as f:
+            f.write(b'{\n  "sourceLanguage": ')
+            f.write(orjson.dumps(xcstrings.source_language))
+            f.write(b',\n  "strings": {')
+
+            first = True
+            for key, entry_dict in self._iter_entries(xcstrings):
+                f.write(b"\n    " if first else b",\n    ")
+                f.write(orjson.dumps(key))
+                f.write(b": ")
+                # Re-indent the entry so it nests under "strings"
+                f.write(
+                    orjson.dumps(entry_dict, option=orjson.OPT_INDENT_2).replace(
+                        b"\n", b"\n    "
+                    )
+                )
+                first = False
+
+            f.write(b"}" if first else b"\n  }")
+            f.write(b',\n  "version": ')
+            f.write(orjson.dumps(xcstrings.version))
+            f.write(b"\n}\n")  # Trailing newline
 
     def to_string(self, xcstrings: XCStringsFile) -> str:
         """
@@ -35,20 +56,30 @@ class XCStringsWriter:
             xcstrings: The XCStringsFile to convert
 
         Returns:
-            JSON string representation
+            JSON string representation (newline-terminated, like write())
+        """
+        return self.to_bytes(xcstrings).decode("utf-8")
+
+    def to_bytes(self, xcstrings: XCStringsFile) -> bytes:
+        """
+        Convert an XCStringsFile to UTF-8 encoded JSON.
+
+        Args:
+            xcstrings: The XCStringsFile to convert
+
+        Returns:
+            JSON bytes, identical to to_string() encoded as UTF-8
         """
         data = self._to_dict(xcstrings)
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
 
     def _to_dict(self, xcstrings: XCStringsFile) -> Dict[str, Any]:
         """Convert XCStringsFile to dictionary for JSON serialization."""
         # Sort strings by key for consistent output
-        sorted_keys = sorted(xcstrings.strings.keys())
-
-        strings_dict = {}
-        for key in sorted_keys:
-            entry = xcstrings.strings[key]
-            strings_dict[key] = self._entry_to_dict(entry)
+        strings_dict = {
+            key: self._entry_to_dict(entry)
+            for key, entry in sorted(xcstrings.strings.items())
+        }
 
         return {
             "sourceLanguage": xcstrings.source_language,
@@ -56,8 +87,24 @@ class XCStringsWriter:
             "version": xcstrings.version,
         }
 
-    def _entry_to_dict(self, entry: StringEntry) -> Dict[str, Any]:
-        """Convert a StringEntry to dictionary."""
+    def _iter_entries(
+        self, xcstrings: XCStringsFile
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Lazily yield (key, entry_dict) pairs sorted by key."""
+        for key, entry in sorted(xcstrings.strings.items()):
+            yield key, self._entry_to_dict(entry, raw_variations=True)
+
+    def _entry_to_dict(
+        self, entry: StringEntry, raw_variations: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Convert a StringEntry to dictionary.
+
+        Args:
+            entry: The entry to convert
+            raw_variations: Emit variations as pre-encoded orjson fragments
+                            (only valid when serializing with orjson)
+        """
         entry_dict: Dict[str, Any] = {}
 
         if entry.comment:
@@ -67,22 +114,21 @@ class XCStringsWriter:
             entry_dict["extractionState"] = entry.extraction_state
 
         if entry.localizations:
-            # Sort localizations by language code for consistent output
-            sorted_langs = sorted(entry.localizations.keys())
-            localizations_dict = {}
-
-            for lang in sorted_langs:
-                loc = entry.localizations[lang]
-                loc_dict = self._localization_to_dict(loc)
-                if loc_dict:  # Only include non-empty localizations
-                    localizations_dict[lang] = loc_dict
+            # Sort localizations by language code; only include non-empty ones
+            localizations_dict = {
+                lang: loc_dict
+                for lang, loc in sorted(entry.localizations.items())
+                if (loc_dict := self._localization_to_dict(loc, raw_variations))
+            }
 
             if localizations_dict:
                 entry_dict["localizations"] = localizations_dict
 
         return entry_dict
 
-    def _localization_to_dict(self, loc: Localization) -> Dict[str, Any]:
+    def _localization_to_dict(
+        self, loc: Localization, raw_variations: bool = False
+    ) -> Dict[str, Any]:
         """Convert a Localization to dictionary."""
         loc_dict: Dict[str, Any] = {}
 
@@ -93,6 +139,24 @@ class XCStringsWriter:
             }
 
         if loc.variations:
-            loc_dict["variations"] = loc.variations
+            if raw_variations:
+                loc_dict["variations"] = orjson.Fragment(self._encode_variations(loc))
+            else:
+                loc_dict["variations"] = loc.variations
 
         return loc_dict
+
+    def _encode_variations(self, loc: Localization) -> bytes:
+        """
+        Encode variations once and keep the bytes on the localization.
+
+        The fragment is pre-indented for its depth inside an entry (three
+        levels), so splicing it into an indented entry dump yields the same
+        bytes as encoding the nested dict directly. Later writes of an
+        unchanged catalog reuse it instead of walking the variations again.
+        """
+        if loc.variations_raw is None:
+            loc.variations_raw = orjson.dumps(
+                loc.variations, option=orjson.OPT_INDENT_2
+            ).replace(b"\n", b"\n      ")
+        return loc.variations_raw
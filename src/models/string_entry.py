@@ -1,10 +1,11 @@
 """Data models for XCStrings file structure."""
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Any
+from functools import cached_property
+from typing import Dict, Optional, Any, Set
 
 
-@dataclass
+@dataclass(slots=True)
 class StringUnit:
     """Represents a single string translation unit."""
 
@@ -12,15 +13,17 @@ class StringUnit:
     state: str = "new"  # new, translated, needs_review, reviewed, flagged, stale
 
 
-@dataclass
+@dataclass(slots=True)
 class Localization:
     """Represents a localization entry for a specific language."""
 
     string_unit: Optional[StringUnit] = None
     variations: Optional[Dict[str, Any]] = None  # For plurals/device variants
+    # Encoded variations reused by the writer; reset whenever variations change
+    variations_raw: Optional[bytes] = field(default=None, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class StringEntry:
     """Represents a single localizable string entry."""
 
@@ -28,6 +31,20 @@ class StringEntry:
     comment: Optional[str] = None
     localizations: Dict[str, Localization] = field(default_factory=dict)
     extraction_state: Optional[str] = None  # manual, extracted_with_value
+    # Languages with a non-empty string unit value (computed from localizations if None)
+    translated_langs: Optional[Set[str]] = field(default=None, repr=False, compare=False)
+    # Shared {language: translated keys} index owned by the enclosing XCStringsFile
+    translated_index: Optional[Dict[str, Set[str]]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Compute translated_langs when the caller did not precompute it."""
+        if self.translated_langs is None:
+            self.translated_langs = {
+                lang for lang, loc in self.localizations.items()
+                if loc.string_unit is not None and loc.string_unit.value != ""
+            }
 
     def get_source_value(self, source_language: str = "en") -> str:
         """Get the source language value for this string."""
@@ -40,16 +57,32 @@ class StringEntry:
 
     def has_translation(self, language: str) -> bool:
         """Check if this string has a translation for the given language."""
-        if language not in self.localizations:
-            return False
-        loc = self.localizations[language]
-        return loc.string_unit is not None and loc.string_unit.value != ""
+        return language in self.translated_langs
 
     def set_translation(self, language: str, value: str, state: str = "translated") -> None:
         """Set a translation for the given language."""
-        self.localizations[language] = Localization(
-            string_unit=StringUnit(value=value, state=state)
-        )
+        loc = self.localizations.get(language)
+        if loc is not None and loc.string_unit is not None:
+            # Update in place rather than allocating a new Localization
+            loc.string_unit.value = value
+            loc.string_unit.state = state
+            loc.variations = None
+            loc.variations_raw = None
+        else:
+            self.localizations[language] = Localization(
+                string_unit=StringUnit(value=value, state=state)
+            )
+
+        if value:
+            self.translated_langs.add(language)
+        else:
+            self.translated_langs.discard(language)
+
+        if self.translated_index is not None:
+            if value:
+                self.translated_index.setdefault(language, set()).add(self.key)
+            elif language in self.translated_index:
+                self.translated_index[language].discard(self.key)
 
 
 @dataclass
@@ -60,20 +93,52 @@ class XCStringsFile:
     strings: Dict[str, StringEntry]
     version: str = "1.0"
 
-    def get_untranslated_keys(self, target_language: str) -> list:
-        """Get list of keys that don't have translations for the target language."""
-        untranslated = []
+    def __post_init__(self):
+        """Build the per-language translation index in a single pass."""
+        self._translated: Dict[str, Set[str]] = {}
         for key, entry in self.strings.items():
-            if not entry.has_translation(target_language):
-                untranslated.append(key)
-        return untranslated
+            for lang in entry.translated_langs:
+                self._translated.setdefault(lang, set()).add(key)
+            entry.translated_index = self._translated
 
-    def get_translatable_strings(self) -> Dict[str, str]:
-        """Get all strings that need translation (key -> source value)."""
+    def get_translated_keys(self, language: str) -> Set[str]:
+        """Get the set of keys that have a translation for the language."""
+        return self._translated.get(language, set())
+
+    def get_untranslated_keys(self, target_language: str) -> list:
+        """Get list of keys that don't have translations for the target language."""
+        translated = self.get_translated_keys(target_language)
+        return [key for key in self.strings if key not in translated]
+
+    def set_translation(self, key: str, language: str, value: str, state: str = "translated") -> None:
+        """
+        Set a string's value for a language, keeping cached views consistent.
+
+        Editing the source language changes which strings are translatable,
+        so the cached translatable map is dropped and rebuilt on next use.
+        """
+        self.strings[key].set_translation(language, value, state)
+        if language == self.source_language:
+            self.__dict__.pop("translatable", None)
+
+    @cached_property
+    def translatable(self) -> Dict[str, str]:
+        """
+        All strings that need translation (key -> source value).
+
+        Computed once and cached. Source values edited through
+        set_translation() refresh it; edits made directly on a StringEntry
+        do not.
+        """
         result = {}
+        source_language = self.source_language
         for key, entry in self.strings.items():
-            source_value = entry.get_source_value(self.source_language)
+            source_value = entry.get_source_value(source_language)
             # Skip empty strings or single characters that don't need translation
-            if source_value and len(source_value.strip()) > 0:
+            if source_value and not source_value.isspace():
                 result[key] = source_value
         return result
+
+    def get_translatable_strings(self) -> Dict[str, str]:
+        """Get all strings that need translation (key -> source value)."""
+        return self.translatable
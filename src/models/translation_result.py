@@ -1,12 +1,16 @@
 """Data models for translation results and quality scoring."""
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Optional, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QualityScore:
-    """Represents the quality assessment of a translation."""
+    """
+    Represents the quality assessment of a translation.
+
+    Immutable, so identical scores (e.g., for skipped strings) can be shared.
+    """
 
     overall: float  # 0-100
     placeholder_score: float  # 0-100
@@ -14,7 +18,7 @@ class QualityScore:
     length_score: float  # 0-100
     format_score: float  # 0-100
     category: str  # "green", "yellow", "red"
-    issues: List[str] = field(default_factory=list)
+    issues: Tuple[str, ...] = ()
 
     @property
     def passed(self) -> bool:
@@ -32,7 +36,7 @@ class QualityScore:
         return self.category == "red"
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationResult:
     """Represents the result of translating a single string."""
 
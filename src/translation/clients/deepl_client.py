@@ -1,11 +1,22 @@
 """DeepL API client for translation."""
 
-import deepl
-from typing import Optional, List
-from dataclasses import dataclass
+import asyncio
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Optional, List, Tuple
+from dataclasses import dataclass, replace
 
+import orjson
+
+from ...cache import LRUMemo, ResponseCache
 from ...config import config
+from .loop_clients import loop_clients
 
+if TYPE_CHECKING:
+    import httpx
 
 @dataclass
 class DeepLResult:
@@ -16,6 +27,22 @@ class DeepLResult:
     billed_characters: int
 
 
+@dataclass
+class DeepLBatchResult:
+    """Column-oriented results of a DeepL batch, one entry per input text."""
+
+    texts: List[str]
+    detected_source_langs: List[Optional[str]]
+    billed_characters: array  # array("l"), one count per text
+
+    def to_results(self) -> List[DeepLResult]:
+        """Expand into one DeepLResult per text."""
+        return [
+            DeepLResult(text=t, detected_source_lang=d, billed_characters=b)
+            for t, d, b in zip(self.texts, self.detected_source_langs, self.billed_characters)
+        ]
+
+
 class DeepLClient:
     """Client for DeepL translation API."""
 
@@ -31,17 +58,49 @@ class DeepLClient:
     # Languages that support formality
     FORMALITY_SUPPORTED = {"DE", "FR", "IT", "ES", "NL", "PL", "PT-BR", "PT-PT", "RU"}
 
-    def __init__(self, api_key: Optional[str] = None):
+    # DeepL accepts at most this many texts per request
+    MAX_TEXTS_PER_REQUEST = 50
+
+    # Stay safely under DeepL's 128 KiB request body limit
+    MAX_CHARS_PER_REQUEST = 120_000
+
+    # REST endpoints for the native async client (free-plan keys end in ":fx")
+    API_URL = "https://api.deepl.com"
+    API_URL_FREE = "https://api-free.deepl.com"
+
+    # Retries for 429/5xx responses on the async client, with exponential backoff
+    MAX_RETRIES = 5
+
+    def __init__(self, api_key: Optional[str] = None, cache: Optional[ResponseCache] = None):
         """
         Initialize the DeepL client.
 
         Args:
             api_key: DeepL API key. If not provided, uses DEEPL_API_KEY from environment.
+            cache: Optional response cache; hits skip the API call and bill nothing
         """
         self.api_key = api_key or config.deepl_api_key
         if not self.api_key:
             raise ValueError("DeepL API key is required")
-        self.translator = deepl.Translator(self.api_key)
+        self.translator = _shared_translator(self.api_key)
+        self.cache = cache
+        # Collapses repeated identical translate() calls within this process
+        self._memo = LRUMemo()
+        # Shared by every client using this key, so new clients skip the usage call
+        self._usage = _shared_usage(self.api_key)
+
+    def _cache_key(
+        self,
+        text: str,
+        target: str,
+        source_lang: Optional[str],
+        formality: str,
+        preserve_formatting: bool,
+    ) -> bytes:
+        """Compute the response cache key for one text."""
+        return self.cache.key(
+            "deepl", target, source_lang or "", formality, str(preserve_formatting), text
+        )
 
     def translate(
         self,
@@ -64,7 +123,22 @@ class DeepLClient:
         Returns:
             DeepLResult with translation and metadata
         """
-        target = self.LANGUAGE_MAP.get(target_lang.lower(), target_lang.upper())
+        memo_key = (text, target_lang, source_lang, formality, preserve_formatting)
+        memoized = self._memo.get(memo_key)
+        if memoized is not None:
+            # Nothing is billed for a repeated call
+            return replace(memoized, billed_characters=0)
+
+        target, source, use_formality = _resolve_langs(target_lang, source_lang, formality)
+
+        cache_key = None
+        if self.cache:
+            cache_key = self._cache_key(text, target, source_lang, formality, preserve_formatting)
+            hit = self.cache.get_many([cache_key]).get(cache_key)
+            if hit:
+                result = DeepLResult(text=hit[0], detected_source_lang=hit[1], billed_characters=0)
+                self._memo.put(memo_key, result)
+                return result
 
         kwargs = {
             "text": text,
@@ -72,22 +146,30 @@ class DeepLClient:
             "preserve_formatting": preserve_formatting,
         }
 
-        if source_lang:
-            kwargs["source_lang"] = self.LANGUAGE_MAP.get(
-                source_lang.lower(), source_lang.upper()
-            )
+        if source:
+            kwargs["source_lang"] = source
 
         # Only set formality for supported languages
-        if formality != "default" and target in self.FORMALITY_SUPPORTED:
+        if use_formality:
             kwargs["formality"] = formality
 
-        result = self.translator.translate_text(**kwargs)
+        self._usage.reserve(len(text))
+        try:
+            result = self.translator.translate_text(**kwargs)
+        except Exception:
+            self._usage.release(len(text))
+            raise
 
-        return DeepLResult(
+        if cache_key is not None:
+            self.cache.put_many([(cache_key, result.text, result.detected_source_lang)])
+
+        deepl_result = DeepLResult(
             text=result.text,
             detected_source_lang=result.detected_source_lang,
             billed_characters=len(text),
         )
+        self._memo.put(memo_key, deepl_result)
+        return deepl_result
 
     def translate_batch(
         self,
@@ -108,44 +190,390 @@ class DeepLClient:
         Returns:
             List of DeepLResult objects
         """
+        return self.translate_batch_soa(texts, target_lang, source_lang, formality).to_results()
+
+    def translate_batch_soa(
+        self,
+        texts: List[str],
+        target_lang: str,
+        source_lang: Optional[str] = None,
+        formality: str = "default",
+    ) -> DeepLBatchResult:
+        """
+        Translate multiple texts in a batch, returning column-oriented results.
+
+        Same as translate_batch() but without building a DeepLResult per text,
+        for callers that only need the parallel columns.
+
+        Args:
+            texts: List of texts to translate
+            target_lang: Target language code
+            source_lang: Source language code (auto-detect if not provided)
+            formality: Formality level
+
+        Returns:
+            DeepLBatchResult with one entry per input text
+        """
+        batch, pending = self._prepare_batch(texts, target_lang, source_lang, formality)
+        if pending is None:
+            return batch
+
+        unique, kwargs, cache_keys = pending
+
+        # Split at the API's per-request limits and send the pieces concurrently
+        chunks = self._pack_requests(list(unique.keys()))
+        try:
+            if len(chunks) == 1:
+                results = self._request_batch(chunks[0], kwargs)
+            else:
+                with ThreadPoolExecutor(max_workers=min(len(chunks), config.max_concurrency)) as pool:
+                    results = [
+                        r for part in pool.map(lambda chunk: self._request_batch(chunk, kwargs), chunks)
+                        for r in part
+                    ]
+        except Exception:
+            self._usage.release(sum(len(t) for t in unique))
+            raise
+
+        self._finish_batch(batch, unique, results, cache_keys)
+        return batch
+
+    def _prepare_batch(
+        self,
+        texts: List[str],
+        target_lang: str,
+        source_lang: Optional[str],
+        formality: str,
+    ) -> Tuple[DeepLBatchResult, Optional[Tuple[Dict[str, List[int]], dict, List[bytes]]]]:
+        """
+        Fill cache hits into a new batch result and reserve quota for the misses.
+
+        Returns:
+            Tuple of (batch result, None when nothing needs the API, otherwise
+            (indices by unique miss text, request options, cache keys))
+        """
+        n = len(texts)
+        out_texts: List[Optional[str]] = [None] * n
+        detected: List[Optional[str]] = [None] * n
+        billed = array("l", [0]) * n
+        batch = DeepLBatchResult(out_texts, detected, billed)
         if not texts:
-            return []
+            return batch, None
+
+        target, source, use_formality = _resolve_langs(target_lang, source_lang, formality)
+
+        # Serve cache hits directly (billing nothing); only misses are sent to the API
+        cache_keys: List[bytes] = []
+        if self.cache:
+            cache_keys = [
+                self._cache_key(t, target, source_lang, formality, True) for t in texts
+            ]
+            hits = self.cache.get_many(cache_keys)
+            for i, key in enumerate(cache_keys):
+                if key in hits:
+                    out_texts[i], detected[i] = hits[key]
+
+        miss_indices = [i for i, t in enumerate(out_texts) if t is None]
+        if not miss_indices:
+            return batch, None
 
-        target = self.LANGUAGE_MAP.get(target_lang.lower(), target_lang.upper())
+        # Send each distinct text once and fan the result out to its duplicates
+        unique: Dict[str, List[int]] = {}
+        for i in miss_indices:
+            unique.setdefault(texts[i], []).append(i)
 
         kwargs = {
-            "text": texts,
             "target_lang": target,
             "preserve_formatting": True,
         }
 
-        if source_lang:
-            kwargs["source_lang"] = self.LANGUAGE_MAP.get(
-                source_lang.lower(), source_lang.upper()
-            )
+        if source:
+            kwargs["source_lang"] = source
 
-        if formality != "default" and target in self.FORMALITY_SUPPORTED:
+        if use_formality:
             kwargs["formality"] = formality
 
-        results = self.translator.translate_text(**kwargs)
+        self._usage.reserve(sum(len(t) for t in unique))
+        return batch, (unique, kwargs, cache_keys)
+
+    def _finish_batch(
+        self,
+        batch: DeepLBatchResult,
+        unique: Dict[str, List[int]],
+        results: list,
+        cache_keys: List[bytes],
+    ) -> None:
+        """Fan API results out to every index of their text and cache them."""
+        for (t, indices), r in zip(unique.items(), results):
+            for i in indices:
+                batch.texts[i] = r.text
+                batch.detected_source_langs[i] = r.detected_source_lang
+            # Only the first occurrence is billed
+            batch.billed_characters[indices[0]] = len(t)
+
+        if self.cache:
+            self.cache.put_many(
+                (cache_keys[indices[0]], r.text, r.detected_source_lang)
+                for indices, r in zip(unique.values(), results)
+            )
+
+    def _pack_requests(self, texts: List[str]) -> List[List[str]]:
+        """Greedily pack texts into requests within both the text and character limits."""
+        chunks: List[List[str]] = []
+        current: List[str] = []
+        chars = 0
+
+        for text in texts:
+            if current and (
+                len(current) >= self.MAX_TEXTS_PER_REQUEST
+                or chars + len(text) > self.MAX_CHARS_PER_REQUEST
+            ):
+                chunks.append(current)
+                current, chars = [], 0
+            current.append(text)
+            chars += len(text)
+
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _request_batch(self, texts: List[str], kwargs: dict) -> list:
+        """Send one translate_text request for texts and always return a list."""
+        results = self.translator.translate_text(text=texts, **kwargs)
 
         # Handle single result case
         if not isinstance(results, list):
             results = [results]
+        return results
+
+    async def atranslate_batch(
+        self,
+        texts: List[str],
+        target_lang: str,
+        source_lang: Optional[str] = None,
+        formality: str = "default",
+    ) -> List[DeepLResult]:
+        """
+        Async version of translate_batch().
+
+        The DeepL SDK only offers a blocking client, so requests go straight
+        to the REST API over a pooled httpx.AsyncClient and all of a batch's
+        requests are in flight at once. Cache and quota bookkeeping run in a
+        worker thread to keep the event loop free.
+        """
+        batch, pending = await asyncio.to_thread(
+            self._prepare_batch, texts, target_lang, source_lang, formality
+        )
+        if pending is not None:
+            unique, kwargs, cache_keys = pending
+            try:
+                parts = await asyncio.gather(
+                    *[
+                        self._arequest_batch(chunk, kwargs)
+                        for chunk in self._pack_requests(list(unique.keys()))
+                    ]
+                )
+            except BaseException:
+                # Also on cancellation, since nothing more will be billed
+                self._usage.release(sum(len(t) for t in unique))
+                raise
+            results = [r for part in parts for r in part]
+            await asyncio.to_thread(self._finish_batch, batch, unique, results, cache_keys)
+        return batch.to_results()
+
+    async def _arequest_batch(self, texts: List[str], kwargs: dict) -> List[DeepLResult]:
+        """
+        Send one /v2/translate request for texts over the async HTTP client.
+
+        429 and 5xx responses are retried with exponential backoff (honoring
+        Retry-After), as the SDK does for the blocking path.
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            response = await self._get_async_client().post(
+                "/v2/translate", json={"text": texts, **kwargs}
+            )
+            retryable = response.status_code == 429 or response.status_code >= 500
+            if not retryable or attempt == self.MAX_RETRIES:
+                break
+            retry_after = response.headers.get("retry-after", "")
+            delay = float(retry_after) if retry_after.isdigit() else min(2 ** attempt, 30)
+            await asyncio.sleep(delay)
+
+        if response.status_code == 456:
+            import deepl
+
+            raise deepl.QuotaExceededException(
+                "Quota for this billing period has been exceeded"
+            )
+        response.raise_for_status()
 
         return [
             DeepLResult(
-                text=r.text,
-                detected_source_lang=r.detected_source_lang,
-                billed_characters=len(t),
+                text=item["text"],
+                detected_source_lang=item.get("detected_source_language"),
+                billed_characters=0,
             )
-            for r, t in zip(results, texts)
+            for item in orjson.loads(response.content)["translations"]
         ]
 
-    def get_usage(self) -> dict:
-        """Get current API usage statistics."""
-        usage = self.translator.get_usage()
-        return {
-            "character_count": usage.character.count if usage.character else 0,
-            "character_limit": usage.character.limit if usage.character else 0,
-        }
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """Get the shared async HTTP client for this API key on the running loop."""
+        return _shared_async_client(self.api_key)
+
+    def get_usage(self, force: bool = False) -> dict:
+        """
+        Get current API usage statistics.
+
+        Served from the locally tracked count, reconciled with the API once
+        it is older than config.usage_ttl_seconds, so polling it does not
+        cost a round trip each time.
+
+        Args:
+            force: Fetch fresh numbers from the API regardless of the last sync
+
+        Returns:
+            Dictionary with character_count and character_limit
+        """
+        used, limit = self._usage.get(force)
+        return {"character_count": used, "character_limit": limit}
+
+
+class _UsageTracker:
+    """
+    Locally tracked character usage for one API key, shared by every client.
+
+    Requests only touch the local count; it is reconciled with the server
+    lazily, when get() finds it older than config.usage_ttl_seconds. While
+    the limit is unknown (never synced, or the last sync failed) nothing is
+    enforced locally and the API stays the authority on the quota.
+    """
+
+    def __init__(self, api_key: str):
+        self.translator = _shared_translator(api_key)
+        self.count = 0
+        self.limit = 0  # 0 while unknown
+        self.synced_at: Optional[float] = None
+        # Guards count/limit only and is never held across I/O, so taking it
+        # from the event loop cannot stall it
+        self._lock = threading.Lock()
+        # Serializes syncs, so concurrent readers share one usage call
+        self._sync_lock = threading.Lock()
+
+    def _sync(self, force: bool = False) -> None:
+        """Fetch usage from the API when stale or forced."""
+        with self._sync_lock:
+            now = time.monotonic()
+            if (
+                not force
+                and self.synced_at is not None
+                and now - self.synced_at < config.usage_ttl_seconds
+            ):
+                return
+
+            # Retried after the TTL either way, so a failing usage call costs at
+            # most one round trip per period
+            self.synced_at = now
+            try:
+                # Read the SDK's character property once
+                character = self.translator.get_usage().character
+            except Exception:
+                # A failed sync must not fail the caller; treat the limit as unknown
+                with self._lock:
+                    self.limit = 0
+                return
+
+            with self._lock:
+                self.count, self.limit = (
+                    (0, 0) if character is None else (character.count, character.limit)
+                )
+
+    def get(self, force: bool = False) -> Tuple[int, int]:
+        """Get the (character count, limit), syncing first if stale or forced."""
+        self._sync(force)
+        with self._lock:
+            return self.count, self.limit
+
+    def reserve(self, count: int) -> None:
+        """
+        Account for characters about to be billed.
+
+        Raises QuotaExceededException before sending when the request would
+        exceed a known character limit, instead of paying a round trip for
+        the API to reject it. Never calls the API itself.
+        """
+        with self._lock:
+            if self.limit and self.count + count > self.limit:
+                import deepl
+
+                raise deepl.QuotaExceededException(
+                    f"DeepL character quota would be exceeded "
+                    f"({self.count} + {count} > {self.limit})"
+                )
+            self.count += count
+
+    def release(self, count: int) -> None:
+        """Give back characters reserved for a request that failed."""
+        with self._lock:
+            self.count = max(0, self.count - count)
+
+
+@lru_cache(maxsize=8)
+def _shared_translator(api_key: str):
+    """
+    Get the process-wide DeepL translator for an API key.
+
+    The SDK keeps a requests.Session per translator, so sharing one lets new
+    DeepLClient instances reuse its warm keep-alive connections.
+    """
+    # Imported here so runs that never touch DeepL skip loading the SDK
+    import deepl
+
+    return deepl.Translator(api_key)
+
+
+def _shared_async_client(api_key: str) -> "httpx.AsyncClient":
+    """
+    Get the shared async HTTP client for an API key on the running loop.
+
+    Every DeepLClient (one per translation job in the web app) reuses the
+    same connection pool instead of opening its own. httpx clients are bound
+    to the loop they were first used on, so each event loop gets its own,
+    closed when the loop shuts down.
+    """
+    clients = loop_clients("deepl")
+    client = clients.get(api_key)
+    if client is None:
+        import httpx
+
+        server = DeepLClient.API_URL_FREE if api_key.endswith(":fx") else DeepLClient.API_URL
+        client = clients[api_key] = httpx.AsyncClient(
+            base_url=server,
+            headers={"Authorization": f"DeepL-Auth-Key {api_key}"},
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32),
+            timeout=httpx.Timeout(60.0, connect=10.0),
+        )
+    return client
+
+
+@lru_cache(maxsize=8)
+def _shared_usage(api_key: str) -> _UsageTracker:
+    """Get the process-wide usage tracker for an API key."""
+    return _UsageTracker(api_key)
+
+
+@lru_cache(maxsize=64)
+def _resolve_langs(
+    target_lang: str, source_lang: Optional[str], formality: str
+) -> Tuple[str, Optional[str], bool]:
+    """
+    Resolve DeepL language codes once per (target, source, formality) combination.
+
+    Returns:
+        Tuple of (target code, source code or None, whether formality applies)
+    """
+    language_map = DeepLClient.LANGUAGE_MAP
+    target = language_map.get(target_lang.lower(), target_lang.upper())
+    source = language_map.get(source_lang.lower(), source_lang.upper()) if source_lang else None
+    use_formality = formality != "default" and target in DeepLClient.FORMALITY_SUPPORTED
+    return target, source, use_formality
@@ -0,0 +1,60 @@
+"""Per-event-loop registries for async API clients, closed with their loop."""
+
+import asyncio
+import weakref
+from typing import Any, AsyncGenerator, Dict
+
+# Client registries per event loop, then per namespace; dropped with their loop
+_registries: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Dict[str, Any]]]" = (
+    weakref.WeakKeyDictionary()
+)
+# The loop tracks its async generators only weakly, so the closers live here
+_closers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGenerator]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def loop_clients(namespace: str) -> Dict[str, Any]:
+    """
+    Get the running loop's client registry for a namespace.
+
+    httpx clients are bound to the loop they were first used on, so each
+    loop gets its own registry. Every client put in it is closed when the
+    loop shuts down its async generators, which asyncio.run (and uvicorn,
+    through it) does before closing the loop, so no connection outlives it.
+
+    Args:
+        namespace: Registry name, e.g. "deepl" or "openai"
+
+    Returns:
+        Mutable mapping of key to client for the running loop
+    """
+    loop = asyncio.get_running_loop()
+    registries = _registries.get(loop)
+    if registries is None:
+        registries = _registries[loop] = {}
+        closer = _closers[loop] = _close_on_shutdown(registries)
+        # Running it to its first yield registers it for shutdown_asyncgens()
+        try:
+            closer.asend(None).send(None)
+        except StopIteration:
+            pass
+    return registries.setdefault(namespace, {})
+
+
+async def _close_on_shutdown(registries: Dict[str, Dict[str, Any]]) -> AsyncGenerator[None, None]:
+    """Suspend until the loop shuts down, then close every registered client."""
+    try:
+        yield
+    finally:
+        # Looked up here rather than captured, so the registry never refers to its loop
+        loop = asyncio.get_running_loop()
+        _registries.pop(loop, None)
+        _closers.pop(loop, None)
+        for clients in registries.values():
+            for client in clients.values():
+                # httpx clients close with aclose(), SDK clients with close()
+                try:
+                    await (getattr(client, "aclose", None) or client.close)()
+                except Exception:
+                    pass
@@ -1,37 +1,106 @@
 """OpenAI GPT-4 client for translation fallback."""
 
+import asyncio
 import json
-from typing import Optional, Dict, List
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional, Dict, List, Tuple
 
+import orjson
+
+from ...cache import LRUMemo, ResponseCache
+from ..rate_limiter import RateLimiter
 from ...config import config
+from .openai_pool import shared_async_client, shared_client
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+
+# Batch item IDs, stringified once instead of on every request
+_ITEM_IDS = tuple(str(i) for i in range(1024))
 
 
 class OpenAIClient:
     """Client for OpenAI GPT-4 translation (fallback provider)."""
 
-    LANGUAGE_NAMES = {
+    LANGUAGE_NAMES = MappingProxyType({
         "de": "German",
         "fr": "French",
         "it": "Italian",
         "es": "Spanish",
         "ro": "Romanian",
         "en": "English",
-    }
+    })
+
+    # Lowercase prefixes GPT sometimes puts before the translation
+    RESPONSE_PREFIXES = (
+        "translation:",
+        "translated:",
+        "here is the translation:",
+        "the translation is:",
+    )
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        client: Optional["OpenAI"] = None,
+        async_client: Optional["AsyncOpenAI"] = None,
+    ):
         """
         Initialize the OpenAI client.
 
         Args:
             api_key: OpenAI API key. If not provided, uses OPENAI_API_KEY from environment.
+            cache: Optional response cache; hits skip the API call
+            client: SDK client to send requests with (uses the shared pool if not provided)
+            async_client: Async SDK client (uses the shared per-loop pool if not provided)
         """
         self.api_key = api_key or config.openai_api_key
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
-        self.client = OpenAI(api_key=self.api_key)
+
+        self.client = client or shared_client(self.api_key)
         self.model = config.openai_model
         self.temperature = config.openai_temperature
+        self.cache = cache
+        # Collapses repeated identical translate() calls within this process
+        self._memo = LRUMemo()
+        self._sys_prompt_cache: Dict[tuple, str] = {}
+        # Glossary sections, keyed by glossary items: (single prompt, batch prompt)
+        self._glossary_blocks: Dict[tuple, Tuple[str, str]] = {}
+        self.rate_limiter = RateLimiter()
+        self._async_client = async_client
+
+    def _get_async_client(self) -> "AsyncOpenAI":
+        """Get the async client, shared with the reviewer unless one was injected."""
+        return self._async_client or shared_async_client(self.api_key)
+
+    def _create(self, **kwargs):
+        """
+        Send a chat completion, pacing it with the rate limiter.
+
+        The raw response is requested so the x-ratelimit-* headers can refill
+        the limiter. 429s are still retried by the SDK, honoring Retry-After.
+        """
+        self.rate_limiter.acquire(self._estimate_request_tokens(kwargs))
+        raw = self.client.chat.completions.with_raw_response.create(**kwargs)
+        self.rate_limiter.update(raw.headers)
+        return raw.parse()
+
+    async def _acreate(self, **kwargs):
+        """Async version of _create() using the pooled async client."""
+        await self.rate_limiter.aacquire(self._estimate_request_tokens(kwargs))
+        raw = await self._get_async_client().chat.completions.with_raw_response.create(**kwargs)
+        self.rate_limiter.update(raw.headers)
+        return raw.parse()
+
+    @staticmethod
+    def _estimate_request_tokens(kwargs: dict) -> int:
+        """Tokens a request counts against the limit: prompt (~4 chars/token) plus max output."""
+        prompt_chars = sum(len(m["content"]) for m in kwargs["messages"])
+        return prompt_chars // 4 + kwargs.get("max_completion_tokens", 0)
 
     def translate(
         self,
@@ -54,19 +123,18 @@ class OpenAIClient:
         Returns:
             Translated text
         """
-        lang_name = self.LANGUAGE_NAMES.get(target_lang.lower(), target_lang)
-
-        system_prompt = self._build_system_prompt(lang_name, glossary, app_context)
-        user_prompt = self._build_user_prompt(text, lang_name, context)
-
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            temperature=self.temperature,
-            max_completion_tokens=500,
+        memo_key = self._memo_key(text, target_lang, context, glossary, app_context)
+        memoized = self._memo.get(memo_key)
+        if memoized is not None:
+            return memoized
+
+        keys, out, misses = self._lookup_cache([text], target_lang, context, glossary, app_context)
+        if not misses:
+            self._memo.put(memo_key, out[0])
+            return out[0]
+
+        response = self._create(
+            **self._single_request(text, target_lang, context, glossary, app_context)
         )
 
         result = response.choices[0].message.content.strip()
@@ -74,8 +142,76 @@ class OpenAIClient:
         # Clean up common GPT formatting issues
         result = self._clean_response(result)
 
+        self._fill_misses(out, keys, [misses], [result])
+        self._memo.put(memo_key, result)
+        return result
+
+    async def atranslate(
+        self,
+        text: str,
+        target_lang: str,
+        context: Optional[str] = None,
+        glossary: Optional[Dict[str, str]] = None,
+        app_context: str = "language learning app",
+    ) -> str:
+        """Async version of translate() using the pooled async client."""
+        memo_key = self._memo_key(text, target_lang, context, glossary, app_context)
+        memoized = self._memo.get(memo_key)
+        if memoized is not None:
+            return memoized
+
+        keys, out, misses = self._lookup_cache([text], target_lang, context, glossary, app_context)
+        if not misses:
+            self._memo.put(memo_key, out[0])
+            return out[0]
+
+        response = await self._acreate(
+            **self._single_request(text, target_lang, context, glossary, app_context)
+        )
+
+        result = self._clean_response(response.choices[0].message.content.strip())
+        self._fill_misses(out, keys, [misses], [result])
+        self._memo.put(memo_key, result)
         return result
 
+    def _memo_key(
+        self,
+        text: str,
+        target_lang: str,
+        context: Optional[str],
+        glossary: Optional[Dict[str, str]],
+        app_context: str,
+    ) -> tuple:
+        """Build the in-process memo key for a single translation."""
+        return (
+            text, target_lang, context, app_context, self.model, self.temperature,
+            frozenset(glossary.items()) if glossary else None,
+        )
+
+    def _single_request(
+        self,
+        text: str,
+        target_lang: str,
+        context: Optional[str],
+        glossary: Optional[Dict[str, str]],
+        app_context: str,
+    ) -> dict:
+        """Build chat completion arguments for a single translation."""
+        lang_name = _language_name(target_lang)
+
+        system_prompt = self._cached_system_prompt(lang_name, glossary, app_context, batch=False)
+        user_prompt = self._build_user_prompt(text, lang_name, context)
+
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "temperature": self.temperature,
+            "max_completion_tokens": 500,
+        }
+
     def translate_batch(
         self,
         texts: List[str],
@@ -100,31 +236,244 @@ class OpenAIClient:
         if not texts:
             return []
 
-        lang_name = self.LANGUAGE_NAMES.get(target_lang.lower(), target_lang)
+        keys, out, misses = self._lookup_cache(texts, target_lang, context, glossary, app_context)
+        if misses:
+            # Send each distinct text once and fan the result out to its duplicates
+            unique = self._group_by_text(texts, misses)
+            chunks = self._token_chunks(list(unique.keys()))
+
+            def request(chunk: List[str], retry: bool = True) -> List[str]:
+                response = self._create(
+                    **self._batch_request(chunk, target_lang, context, glossary, app_context)
+                )
+                translations = self._batch_result(response.choices[0].message.content, len(chunk))
+
+                # Re-request only the items a partial response left out
+                missing = [i for i, t in enumerate(translations) if not t]
+                if retry and 0 < len(missing) < len(chunk):
+                    retried = request([chunk[i] for i in missing], retry=False)
+                    for i, translation in zip(missing, retried):
+                        translations[i] = translation
+                return translations
+
+            # Oversized inputs are split and the requests sent concurrently
+            if len(chunks) == 1:
+                translations = request(chunks[0])
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(len(chunks), config.max_concurrency)
+                ) as pool:
+                    translations = [t for part in pool.map(request, chunks) for t in part]
 
-        # Build batch request
-        batch_items = [{"id": str(i), "text": t} for i, t in enumerate(texts)]
+            self._fill_misses(out, keys, list(unique.values()), translations)
 
-        system_prompt = self._build_batch_system_prompt(lang_name, glossary, app_context)
-        user_prompt = self._build_batch_user_prompt(batch_items, lang_name, context)
+        return out
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
+    async def atranslate_batch(
+        self,
+        texts: List[str],
+        target_lang: str,
+        context: Optional[str] = None,
+        glossary: Optional[Dict[str, str]] = None,
+        app_context: str = "language learning app",
+    ) -> List[str]:
+        """Async version of translate_batch() using the pooled async client."""
+        if not texts:
+            return []
+
+        keys, out, misses = self._lookup_cache(texts, target_lang, context, glossary, app_context)
+        if misses:
+            # Send each distinct text once and fan the result out to its duplicates
+            unique = self._group_by_text(texts, misses)
+            chunks = self._token_chunks(list(unique.keys()))
+            semaphore = asyncio.Semaphore(config.max_concurrency)
+
+            async def request(chunk: List[str], retry: bool = True) -> List[str]:
+                async with semaphore:
+                    response = await self._acreate(
+                        **self._batch_request(chunk, target_lang, context, glossary, app_context)
+                    )
+                translations = self._batch_result(response.choices[0].message.content, len(chunk))
+
+                # Re-request only the items a partial response left out
+                missing = [i for i, t in enumerate(translations) if not t]
+                if retry and 0 < len(missing) < len(chunk):
+                    retried = await request([chunk[i] for i in missing], retry=False)
+                    for i, translation in zip(missing, retried):
+                        translations[i] = translation
+                return translations
+
+            # Oversized inputs are split and the requests sent concurrently
+            parts = await asyncio.gather(*[request(chunk) for chunk in chunks])
+            self._fill_misses(
+                out, keys, list(unique.values()), [t for part in parts for t in part]
+            )
+
+        return out
+
+    def _lookup_cache(
+        self,
+        texts: List[str],
+        target_lang: str,
+        context: Optional[str],
+        glossary: Optional[Dict[str, str]],
+        app_context: str,
+    ) -> Tuple[Optional[List[bytes]], List[Optional[str]], List[int]]:
+        """
+        Resolve texts against the response cache.
+
+        Returns:
+            Tuple of (cache keys or None without a cache, results with hits
+            filled in, indices of texts that still need the API)
+        """
+        out: List[Optional[str]] = [None] * len(texts)
+        if not self.cache:
+            return None, out, list(range(len(texts)))
+
+        glossary_part = json.dumps(glossary, sort_keys=True, ensure_ascii=False) if glossary else ""
+        keys = [
+            self.cache.key(
+                "openai", self.model, str(self.temperature), target_lang.lower(),
+                context or "", glossary_part, app_context, text,
+            )
+            for text in texts
+        ]
+        hits = self.cache.get_many(keys)
+
+        misses = []
+        for i, key in enumerate(keys):
+            if key in hits:
+                out[i] = hits[key][0]
+            else:
+                misses.append(i)
+        return keys, out, misses
+
+    def _estimate_output_tokens(self, text: str) -> int:
+        """Expected completion-token cost of one batch item (output may run ~2x the input, plus JSON)."""
+        return _count_tokens(self.model, text) * 2 + 10
+
+    def _token_chunks(self, texts: List[str]) -> List[List[str]]:
+        """Split texts so each batch's expected output fits openai_batch_max_tokens."""
+        budget = config.openai_batch_max_tokens
+        chunks: List[List[str]] = []
+        current: List[str] = []
+        used = 0
+
+        for text in texts:
+            cost = self._estimate_output_tokens(text)
+            if current and used + cost > budget:
+                chunks.append(current)
+                current, used = [], 0
+            current.append(text)
+            used += cost
+
+        if current:
+            chunks.append(current)
+        return chunks
+
+    @staticmethod
+    def _group_by_text(texts: List[str], indices: List[int]) -> Dict[str, List[int]]:
+        """Group indices by their text, in first-occurrence order."""
+        unique: Dict[str, List[int]] = {}
+        for i in indices:
+            unique.setdefault(texts[i], []).append(i)
+        return unique
+
+    def _fill_misses(
+        self,
+        out: List[Optional[str]],
+        keys: Optional[List[bytes]],
+        groups: List[List[int]],
+        translations: List[str],
+    ) -> None:
+        """Scatter each API translation to its group of indices and cache the non-empty ones."""
+        for indices, translation in zip(groups, translations):
+            for i in indices:
+                out[i] = translation
+
+        if keys is not None:
+            self.cache.put_many(
+                (keys[indices[0]], translation, None)
+                for indices, translation in zip(groups, translations)
+                if translation
+            )
+
+    def _batch_request(
+        self,
+        texts: List[str],
+        target_lang: str,
+        context: Optional[str],
+        glossary: Optional[Dict[str, str]],
+        app_context: str,
+    ) -> dict:
+        """Build chat completion arguments for a JSON batch translation."""
+        lang_name = _language_name(target_lang)
+
+        system_prompt = self._cached_system_prompt(lang_name, glossary, app_context, batch=True)
+        user_prompt = self._build_batch_user_prompt(texts, lang_name, context)
+
+        return {
+            "model": self.model,
+            "messages": [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
-            temperature=self.temperature,
-            max_completion_tokens=config.openai_batch_max_tokens,
-            response_format={"type": "json_object"},
-        )
+            "temperature": self.temperature,
+            # The full budget, not the output estimate: reasoning tokens count
+            # against it too, and _token_chunks already sizes batches to fit
+            "max_completion_tokens": config.openai_batch_max_tokens,
+            "response_format": {"type": "json_object"},
+        }
+
+    def _batch_result(self, content: str, count: int) -> List[str]:
+        """Parse a batch response into translations ordered like the input."""
+        parsed = self._parse_batch_response(content)
+
+        # Ensure order matches input by scattering each item to its ID
+        out = [""] * count
+        for item in parsed:
+            try:
+                idx = int(item["id"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if 0 <= idx < count:
+                out[idx] = item.get("translation", "")
+        return out
+
+    def _cached_system_prompt(
+        self,
+        lang_name: str,
+        glossary: Optional[Dict[str, str]],
+        app_context: str,
+        batch: bool,
+    ) -> str:
+        """
+        Get the system prompt, building it once per distinct input.
 
-        result_text = response.choices[0].message.content.strip()
-        parsed = self._parse_batch_response(result_text)
+        Byte-identical prompts across calls also let OpenAI's automatic
+        prompt caching discount the shared prefix.
+        """
+        glossary_key = tuple(sorted(glossary.items())) if glossary else None
+        key = (lang_name, glossary_key, app_context, batch)
+
+        prompt = self._sys_prompt_cache.get(key)
+        if prompt is None:
+            build = self._build_batch_system_prompt if batch else self._build_system_prompt
+            prompt = self._sys_prompt_cache[key] = build(lang_name, glossary, app_context)
+        return prompt
 
-        # Ensure order matches input by using IDs
-        result_map = {item["id"]: item.get("translation", "") for item in parsed}
-        return [result_map.get(str(i), "") for i in range(len(texts))]
+    def _glossary_block(self, glossary: Dict[str, str]) -> Tuple[str, str]:
+        """Get the glossary sections for the single and batch system prompts, built once per glossary."""
+        key = tuple(glossary.items())
+        blocks = self._glossary_blocks.get(key)
+        if blocks is None:
+            blocks = self._glossary_blocks[key] = (
+                "\n\nGLOSSARY (use these exact terms in your translation):\n"
+                + "".join(f"- '{term}' → '{translation}'\n" for term, translation in key),
+                "\n\nGLOSSARY:\n"
+                + "".join(f"- '{term}' -> '{translation}'\n" for term, translation in key),
+            )
+        return blocks
 
     def _build_batch_system_prompt(
         self,
@@ -148,21 +497,21 @@ CRITICAL RULES:
 6. If unable to translate an item, use the original text"""
 
         if glossary:
-            prompt += "\n\nGLOSSARY:\n"
-            for term, translation in glossary.items():
-                prompt += f"- '{term}' -> '{translation}'\n"
+            prompt += self._glossary_block(glossary)[1]
 
         return prompt
 
     def _build_batch_user_prompt(
         self,
-        batch_items: List[Dict[str, str]],
+        texts: List[str],
         lang_name: str,
         context: Optional[str],
     ) -> str:
         """Build user prompt for batch translation."""
-        request_obj = {"translations": batch_items}
-        prompt = f"Translate to {lang_name}:\n\n{json.dumps(request_obj, indent=2)}"
+        ids = _ITEM_IDS if len(texts) <= len(_ITEM_IDS) else map(str, range(len(texts)))
+        request_obj = {"translations": [{"id": i, "text": t} for i, t in zip(ids, texts)]}
+        # Compact, non-ASCII-escaped JSON keeps the prompt's token count down
+        prompt = f"Translate to {lang_name}:\n\n{orjson.dumps(request_obj).decode('utf-8')}"
 
         if context:
             prompt += f"\n\n[UI Context: {context}]"
@@ -170,9 +519,15 @@ CRITICAL RULES:
         return prompt
 
     def _parse_batch_response(self, response: str) -> List[Dict[str, str]]:
-        """Parse JSON response from batch translation."""
+        """
+        Parse JSON response from batch translation.
+
+        Truncated or otherwise malformed output is salvaged item by item, so
+        only the items that are actually missing need another request.
+        """
         try:
-            data = json.loads(response)
+            # orjson skips surrounding whitespace, so the content needs no strip()
+            data = orjson.loads(response)
             # Handle both direct array and wrapped object
             if isinstance(data, list):
                 return data
@@ -180,8 +535,11 @@ CRITICAL RULES:
                 return data["translations"]
             else:
                 raise ValueError("Unexpected JSON structure")
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Failed to parse batch response: {e}")
+        except orjson.JSONDecodeError as e:
+            items = _BatchItemScanner().feed(response)
+            if not items:
+                raise ValueError(f"Failed to parse batch response: {e}")
+            return items
 
     def _build_system_prompt(
         self,
@@ -218,9 +576,7 @@ CRITICAL RULES - FOLLOW EXACTLY:
 8. If translation is absolutely impossible, respond with: [UNABLE]"""
 
         if glossary:
-            prompt += "\n\nGLOSSARY (use these exact terms in your translation):\n"
-            for term, translation in glossary.items():
-                prompt += f"- '{term}' → '{translation}'\n"
+            prompt += self._glossary_block(glossary)[0]
 
         return prompt
 
@@ -241,20 +597,100 @@ CRITICAL RULES - FOLLOW EXACTLY:
     def _clean_response(self, response: str) -> str:
         """Clean up common GPT formatting issues."""
         # Remove surrounding quotes if present
-        if (response.startswith('"') and response.endswith('"')) or (
-            response.startswith("'") and response.endswith("'")
-        ):
+        if len(response) >= 2 and response[0] == response[-1] and response[0] in "\"'":
             response = response[1:-1]
 
-        # Remove common prefixes
-        prefixes_to_remove = [
-            "Translation:",
-            "Translated:",
-            "Here is the translation:",
-            "The translation is:",
-        ]
-        for prefix in prefixes_to_remove:
-            if response.lower().startswith(prefix.lower()):
-                response = response[len(prefix) :].strip()
+        # Remove a common prefix (matched case-insensitively in one C-level call)
+        lower = response.lower()
+        if lower.startswith(self.RESPONSE_PREFIXES):
+            prefix = next(p for p in self.RESPONSE_PREFIXES if lower.startswith(p))
+            response = response[len(prefix):].strip()
 
         return response
+
+
+class _BatchItemScanner:
+    """
+    Extracts complete items from a truncated or malformed {"translations": [...]} response.
+
+    Tracks string/escape state and brace depth over the text fed so far;
+    each time an object inside the array closes it is parsed and returned.
+    """
+
+    def __init__(self):
+        """Create a scanner with an empty buffer."""
+        self._buffer = ""
+        self._pos = 0
+        self._in_array = False
+        self._in_string = False
+        self._escaped = False
+        self._depth = 0
+        self._start = 0
+
+    def feed(self, text: str) -> List[dict]:
+        """Append streamed text and return every item completed by it."""
+        self._buffer += text
+        items = []
+        buffer = self._buffer
+
+        for pos in range(self._pos, len(buffer)):
+            char = buffer[pos]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif not self._in_array:
+                self._in_array = char == "["
+            elif char == "{":
+                if self._depth == 0:
+                    self._start = pos
+                self._depth += 1
+            elif char == "}" and self._depth:
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        items.append(orjson.loads(buffer[self._start:pos + 1]))
+                    except orjson.JSONDecodeError:
+                        pass
+
+        # Drop text already consumed, keeping any partially received item
+        keep_from = self._start if self._depth else len(buffer)
+        self._buffer = buffer[keep_from:]
+        self._start -= keep_from
+        self._pos = len(self._buffer)
+        return items
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str):
+    """Get the tiktoken encoding for model, or None when tiktoken is unavailable."""
+    try:
+        import tiktoken
+
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # Not installed, or its encoding files could not be downloaded
+        return None
+
+
+@lru_cache(maxsize=65536)
+def _count_tokens(model: str, text: str) -> int:
+    """Count the tokens of text for model, estimating ~4 chars/token without tiktoken."""
+    encoding = _encoding(model)
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+@lru_cache(maxsize=64)
+def _language_name(target_lang: str) -> str:
+    """Resolve a language code to the name used in prompts (cached per code)."""
+    return OpenAIClient.LANGUAGE_NAMES.get(target_lang.lower(), target_lang)
@@ -0,0 +1,64 @@
+"""Process-wide OpenAI clients shared by the translator and the reviewer."""
+
+import atexit
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from .loop_clients import loop_clients
+
+if TYPE_CHECKING:
+    import httpx
+    from openai import AsyncOpenAI, OpenAI
+
+@lru_cache(maxsize=1)
+def _shared_http_client() -> "httpx.Client":
+    """
+    Get the process-wide HTTP client used by every sync OpenAI client.
+
+    Sharing one pool means new OpenAIClient/LLMReviewer instances reuse warm
+    keep-alive connections instead of paying fresh TLS handshakes.
+    """
+    import httpx
+
+    client = httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        timeout=httpx.Timeout(60.0, connect=10.0),
+    )
+    atexit.register(client.close)
+    return client
+
+
+@lru_cache(maxsize=8)
+def shared_client(api_key: str) -> "OpenAI":
+    """Get the process-wide sync OpenAI client for an API key."""
+    # Imported here so runs that never touch OpenAI skip loading the SDK
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key, http_client=_shared_http_client())
+
+
+def shared_async_client(api_key: str) -> "AsyncOpenAI":
+    """
+    Get the shared async OpenAI client for an API key on the running loop.
+
+    Uses a pooled HTTP/2 connection so concurrent requests multiplex over a
+    single connection. httpx clients are bound to the loop they were first
+    used on, so each event loop gets its own client, closed when the loop
+    shuts down.
+    """
+    clients = loop_clients("openai")
+    client = clients.get(api_key)
+    if client is None:
+        import httpx
+        from openai import AsyncOpenAI
+
+        client = clients[api_key] = AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+                timeout=httpx.Timeout(60.0, connect=10.0),
+            ),
+        )
+    return client
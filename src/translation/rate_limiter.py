@@ -0,0 +1,93 @@
+"""Rate limiter driven by the provider's rate-limit response headers."""
+
+import asyncio
+import re
+import threading
+import time
+from typing import Mapping, Optional
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_duration(value: str) -> float:
+    """Parse an OpenAI reset duration like "1s", "6m0s" or "20ms" into seconds."""
+    return sum(
+        float(amount) * _UNIT_SECONDS[unit] for amount, unit in _DURATION_PART.findall(value)
+    )
+
+
+class RateLimiter:
+    """
+    Token bucket refilled from x-ratelimit-* response headers.
+
+    Each response reports how many requests and tokens remain in the current
+    window and when each window resets. Before sending, acquire() reserves
+    from those budgets and sleeps until the reset when a budget is exhausted,
+    instead of sending a request that would come back as a 429. Until the
+    first response arrives (or after a window resets) nothing is known, so
+    calls pass straight through.
+    """
+
+    def __init__(self):
+        """Create a limiter with unknown remaining budgets."""
+        self._lock = threading.Lock()
+        self.requests_remaining: Optional[int] = None
+        self.tokens_remaining: Optional[int] = None
+        self.requests_reset_at = 0.0
+        self.tokens_reset_at = 0.0
+
+    def acquire(self, tokens: int) -> None:
+        """Block until a request of the given token cost may be sent."""
+        while True:
+            wait = self._reserve(tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int) -> None:
+        """Async version of acquire() that sleeps without blocking the loop."""
+        while True:
+            wait = self._reserve(tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Refresh the budgets from a response's rate-limit headers."""
+        now = time.monotonic()
+        with self._lock:
+            if "x-ratelimit-remaining-requests" in headers:
+                self.requests_remaining = int(headers["x-ratelimit-remaining-requests"])
+                self.requests_reset_at = now + _parse_duration(
+                    headers.get("x-ratelimit-reset-requests", "")
+                )
+            if "x-ratelimit-remaining-tokens" in headers:
+                self.tokens_remaining = int(headers["x-ratelimit-remaining-tokens"])
+                self.tokens_reset_at = now + _parse_duration(
+                    headers.get("x-ratelimit-reset-tokens", "")
+                )
+
+    def _reserve(self, tokens: int) -> float:
+        """Reserve budget for one request, or return how long to wait first."""
+        now = time.monotonic()
+        with self._lock:
+            # A window that has reset is refilled to an unknown level
+            if now >= self.requests_reset_at:
+                self.requests_remaining = None
+            if now >= self.tokens_reset_at:
+                self.tokens_remaining = None
+
+            wait = 0.0
+            if self.requests_remaining is not None and self.requests_remaining <= 0:
+                wait = max(wait, self.requests_reset_at - now)
+            if self.tokens_remaining is not None and self.tokens_remaining < tokens:
+                wait = max(wait, self.tokens_reset_at - now)
+            if wait > 0:
+                return wait
+
+            if self.requests_remaining is not None:
+                self.requests_remaining -= 1
+            if self.tokens_remaining is not None:
+                self.tokens_remaining -= tokens
+            return 0.0
@@ -1,22 +1,68 @@
 """Hybrid translator with DeepL primary and GPT-4 fallback."""
 
-from typing import List, Dict, Optional, Callable
-from dataclasses import dataclass
+import asyncio
+import atexit
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import AsyncIterator, Iterator, List, Dict, Literal, Optional, Callable, Tuple
+from dataclasses import dataclass, replace
+
+import orjson
 
 from ..models.translation_result import TranslationResult, QualityScore
 from ..validation.quality_scorer import QualityScorer
 from .clients.deepl_client import DeepLClient
 from .clients.openai_client import OpenAIClient
+from ..cache import CachedTranslation, ResponseCache, TranslationCache
 from ..config import config
 
-
-@dataclass
+# Whole strings to skip, in one pass: file extensions (".json"), URLs, and
+# strings made only of placeholder characters (e.g., "%@", "%lld", "1/2")
+_SKIP_RE = re.compile(r"\..{0,4}|(?:https?://|www\.).*|[%@dlfs\d$\s\-/]+", re.DOTALL)
+
+# Shared by every skipped string; QualityScore is immutable
+_SKIP_QUALITY = QualityScore(
+    overall=100,
+    placeholder_score=100,
+    glossary_score=100,
+    length_score=100,
+    format_score=100,
+    category="green",
+)
+
+
+def _chunk_items(strings: Dict[int, str], size: int) -> Iterator[Tuple[List[int], List[str]]]:
+    """Split {position: text} into (positions, texts) chunks of at most size, in one pass."""
+    items = iter(strings.items())
+    while chunk := list(islice(items, size)):
+        positions, texts = zip(*chunk)
+        yield list(positions), list(texts)
+
+
+@lru_cache(maxsize=128)
+def _error_quality(error: str) -> QualityScore:
+    """Get the (shared) failing score for an error message."""
+    return QualityScore(
+        overall=0,
+        placeholder_score=0,
+        glossary_score=0,
+        length_score=0,
+        format_score=0,
+        category="red",
+        issues=(error,),
+    )
+
+
+@dataclass(slots=True)
 class TranslationStats:
     """Statistics for a translation batch."""
 
     total: int = 0
     deepl_count: int = 0
     gpt4_count: int = 0
+    cached_count: int = 0
     failed_count: int = 0
     green_count: int = 0
     yellow_count: int = 0
@@ -40,6 +86,8 @@ class HybridTranslator:
         openai_api_key: Optional[str] = None,
         quality_threshold: float = 80.0,
         glossary: Optional[Dict[str, Dict[str, str]]] = None,
+        cache: Optional[ResponseCache] = None,
+        translation_cache: Optional[TranslationCache] = None,
     ):
         """
         Initialize the hybrid translator.
@@ -49,11 +97,34 @@ class HybridTranslator:
             openai_api_key: OpenAI API key (uses env if not provided)
             quality_threshold: Score below which GPT-4 fallback is triggered
             glossary: Optional glossary for consistent terminology
+            cache: Optional response cache shared by both API clients
+            translation_cache: Optional cache of accepted translations from
+                               earlier runs; hits skip translation and scoring
         """
-        self.deepl = DeepLClient(api_key=deepl_api_key)
-        self.openai = OpenAIClient(api_key=openai_api_key)
+        self.deepl = DeepLClient(api_key=deepl_api_key, cache=cache)
+        self.openai = OpenAIClient(api_key=openai_api_key, cache=cache)
         self.scorer = QualityScorer(glossary=glossary)
         self.quality_threshold = quality_threshold
+        self.translation_cache = translation_cache
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _provider_semaphore(self, provider: str) -> asyncio.Semaphore:
+        """
+        Get the semaphore bounding in-flight requests to a provider.
+
+        Shared by every batch and language on the running event loop, so
+        concurrent languages together stay within the provider's rate limits.
+        Semaphores are bound to their loop, so new ones are made if it changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphores = {
+                "deepl": asyncio.Semaphore(config.deepl_concurrency),
+                "openai": asyncio.Semaphore(config.openai_concurrency),
+            }
+            self._semaphore_loop = loop
+        return self._semaphores[provider]
 
     def translate(
         self,
@@ -76,45 +147,9 @@ class HybridTranslator:
         Returns:
             TranslationResult with translation and quality score
         """
-        # Skip empty or trivial strings
-        if not source or not source.strip():
-            return TranslationResult(
-                key=key,
-                source=source,
-                translation=source,
-                target_lang=target_lang,
-                quality_score=QualityScore(
-                    overall=100,
-                    placeholder_score=100,
-                    glossary_score=100,
-                    length_score=100,
-                    format_score=100,
-                    category="green",
-                    issues=[],
-                ),
-                provider="skip",
-                fallback_used=False,
-            )
-
-        # Skip strings that are just placeholders or symbols
-        if self._is_non_translatable(source):
-            return TranslationResult(
-                key=key,
-                source=source,
-                translation=source,
-                target_lang=target_lang,
-                quality_score=QualityScore(
-                    overall=100,
-                    placeholder_score=100,
-                    glossary_score=100,
-                    length_score=100,
-                    format_score=100,
-                    category="green",
-                    issues=[],
-                ),
-                provider="skip",
-                fallback_used=False,
-            )
+        # Skip empty strings and strings that are just placeholders or symbols
+        if self._classify(source) == "skip":
+            return self._create_skip_result(key, source, target_lang)
 
         fallback_used = False
         provider = "deepl"
@@ -167,15 +202,7 @@ class HybridTranslator:
                 source=source,
                 translation="",
                 target_lang=target_lang,
-                quality_score=QualityScore(
-                    overall=0,
-                    placeholder_score=0,
-                    glossary_score=0,
-                    length_score=0,
-                    format_score=0,
-                    category="red",
-                    issues=[str(e)],
-                ),
+                quality_score=_error_quality(str(e)),
                 provider=provider,
                 fallback_used=fallback_used,
                 error=str(e),
@@ -187,87 +214,168 @@ class HybridTranslator:
         target_lang: str,
         context: Optional[str] = None,
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        max_concurrency: Optional[int] = None,
     ) -> tuple[List[TranslationResult], TranslationStats]:
         """
         Translate a batch of strings using batched API calls.
 
+        Blocking wrapper around atranslate_batch() for callers without an
+        event loop.
+
+        Args:
+            strings: Dictionary of {key: source_text}
+            target_lang: Target language code
+            context: Optional shared context for translations
+            progress_callback: Optional callback(current, total, status_message) for progress updates
+            max_concurrency: Maximum API sub-batches in flight at once
+                             (uses config.max_concurrency if not provided)
+
+        Returns:
+            Tuple of (list of results, statistics)
+        """
+        return asyncio.run(
+            self.atranslate_batch(
+                strings, target_lang, context, progress_callback, max_concurrency
+            )
+        )
+
+    async def atranslate_batch(
+        self,
+        strings: Dict[str, str],
+        target_lang: str,
+        context: Optional[str] = None,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> tuple[List[TranslationResult], TranslationStats]:
+        """
+        Translate a batch of strings, sending API sub-batches concurrently.
+
         Args:
             strings: Dictionary of {key: source_text}
             target_lang: Target language code
             context: Optional shared context for translations
             progress_callback: Optional callback(current, total, status_message) for progress updates
+            max_concurrency: Maximum API sub-batches in flight at once
+                             (uses config.max_concurrency if not provided)
 
         Returns:
             Tuple of (list of results, statistics)
         """
-        results: Dict[str, TranslationResult] = {}
-        stats = TranslationStats(total=len(strings))
+        max_concurrency = max_concurrency or config.max_concurrency
+        keys = list(strings)
+        total = len(keys)
+        # Results are written by position, so they come out in input order
+        results: List[Optional[TranslationResult]] = [None] * total
+        stats = TranslationStats(total=total)
+
+        # Repeated (source, translation) pairs, such as "OK" or "Cancel" under
+        # many keys, are scored once; QualityScore is immutable so it is shared
+        scores: Dict[Tuple[str, str], QualityScore] = {}
+
+        def score_all(pairs: List[Tuple[str, str]]) -> List[QualityScore]:
+            # New pairs are scored together, sharing one placeholder scan
+            new = list(dict.fromkeys(pair for pair in pairs if pair not in scores))
+            if new:
+                scores.update(zip(new, self.scorer.score_many(new, target_lang)))
+            return [scores[pair] for pair in pairs]
 
         # Step 1: Separate translatable from non-translatable
-        translatable: Dict[str, str] = {}
-        for key, source in strings.items():
-            if not source or not source.strip() or self._is_non_translatable(source):
+        translatable: Dict[int, str] = {}
+        sources = list(strings.values())
+        skip_flags = await self._non_translatable_flags(sources)
+        for i, (source, skip) in enumerate(zip(sources, skip_flags)):
+            if skip:
                 # Skip non-translatable strings
-                results[key] = self._create_skip_result(key, source, target_lang)
+                results[i] = self._create_skip_result(keys[i], source, target_lang)
             else:
-                translatable[key] = source
+                translatable[i] = source
+
+        # Reuse translations accepted by earlier runs; only misses go to the APIs
+        if self.translation_cache and translatable:
+            for i, hit in self.translation_cache.get_many(translatable, target_lang).items():
+                result = self._create_cached_result(keys[i], translatable.pop(i), target_lang, hit)
+                results[i] = result
+                stats.cached_count += 1
+                self._update_quality_stats(stats, result.quality_score)
 
         if not translatable:
-            return list(results.values()), stats
+            return results, stats
+
+        # Send each distinct source once; other keys with the same text
+        # ("OK", "Cancel", ...) get a copy of its result at the end
+        first_positions: Dict[str, int] = {}
+        duplicates: Dict[int, List[int]] = {}
+        for i, source in list(translatable.items()):
+            first = first_positions.setdefault(source, i)
+            if first != i:
+                duplicates.setdefault(first, []).append(i)
+                del translatable[i]
 
         # Step 2: Batch DeepL translation
         if progress_callback:
-            progress_callback(0, len(strings), "Translating with DeepL...")
-
-        deepl_results = self._batch_translate_deepl(
-            translatable, target_lang, progress_callback, len(strings)
-        )
-
-        # Step 3: Score DeepL results and identify fallbacks needed
-        if progress_callback:
-            progress_callback(len(deepl_results), len(strings), "Scoring translations...")
-
-        fallback_needed: Dict[str, str] = {}
-        for key, (source, translation) in deepl_results.items():
-            # Empty translation means DeepL failed, needs fallback
-            if not translation:
-                fallback_needed[key] = source
-                continue
+            progress_callback(total - len(translatable), total, "Translating with DeepL...")
+
+        # Step 3: Score DeepL results and identify fallbacks needed. Each
+        # sub-batch is scored as soon as it arrives, while the rest are in flight
+        fallback_needed: Dict[int, str] = {}
+        accepted: List[TranslationResult] = []
+        async for deepl_results in self._batch_translate_deepl(
+            translatable, target_lang, progress_callback, total, max_concurrency
+        ):
+            gated = []
+            for i, source, translation in deepl_results:
+                # Empty translation means DeepL failed, needs fallback; so does one
+                # the cheap checks already rule out, without building a full score
+                if not translation or not self.scorer.fast_gate(
+                    source, translation, self.quality_threshold
+                ):
+                    fallback_needed[i] = source
+                else:
+                    gated.append((i, source, translation))
 
-            quality = self.scorer.score(source, translation, target_lang)
+            qualities = score_all([(source, translation) for _, source, translation in gated])
+            for (i, source, translation), quality in zip(gated, qualities):
+                if quality.overall < self.quality_threshold or quality.category == "red":
+                    fallback_needed[i] = source
+                else:
+                    results[i] = TranslationResult(
+                        key=keys[i],
+                        source=source,
+                        translation=translation,
+                        target_lang=target_lang,
+                        quality_score=quality,
+                        provider="deepl",
+                        fallback_used=False,
+                    )
+                    accepted.append(results[i])
+                    stats.deepl_count += 1
+                    self._update_quality_stats(stats, quality)
 
-            if quality.overall < self.quality_threshold or quality.category == "red":
-                fallback_needed[key] = source
-            else:
-                results[key] = TranslationResult(
-                    key=key,
-                    source=source,
-                    translation=translation,
-                    target_lang=target_lang,
-                    quality_score=quality,
-                    provider="deepl",
-                    fallback_used=False,
-                )
-                stats.deepl_count += 1
-                self._update_quality_stats(stats, quality)
+        if self.translation_cache and accepted:
+            self.translation_cache.put_results(accepted)
 
         # Step 4: Batch OpenAI fallback for low-quality results
         if fallback_needed:
             if progress_callback:
                 progress_callback(
-                    len(results), len(strings),
+                    total - len(fallback_needed), total,
                     f"Re-translating {len(fallback_needed)} strings with GPT-4..."
                 )
 
-            openai_results = self._batch_translate_openai(
-                fallback_needed, target_lang, context, progress_callback, len(strings)
+            openai_results = await self._batch_translate_openai(
+                fallback_needed, target_lang, context, progress_callback, total,
+                max_concurrency,
             )
 
-            for key, (source, translation) in openai_results.items():
+            score_all([
+                (source, translation) for _, source, translation in openai_results
+                if translation
+            ])
+            for i, source, translation in openai_results:
                 if translation:
-                    quality = self.scorer.score(source, translation, target_lang)
-                    results[key] = TranslationResult(
-                        key=key,
+                    quality = scores[source, translation]
+                    results[i] = TranslationResult(
+                        key=keys[i],
                         source=source,
                         translation=translation,
                         target_lang=target_lang,
@@ -275,127 +383,235 @@ class HybridTranslator:
                         provider="gpt4",
                         fallback_used=True,
                     )
+                    accepted.append(results[i])
                     stats.gpt4_count += 1
                     self._update_quality_stats(stats, quality)
                 else:
                     # Both DeepL and OpenAI failed
                     stats.failed_count += 1
-                    results[key] = self._create_error_result(
-                        key, source, target_lang, "Translation failed"
+                    results[i] = self._create_error_result(
+                        keys[i], source, target_lang, "Translation failed"
                     )
 
+            if self.translation_cache:
+                self.translation_cache.put_results(
+                    r for r in accepted if r.provider == "gpt4"
+                )
+
         # Step 5: Handle any remaining errors
-        for key in translatable:
-            if key not in results:
+        for i, source in translatable.items():
+            if results[i] is None:
                 stats.failed_count += 1
-                results[key] = self._create_error_result(
-                    key, translatable[key], target_lang, "Translation failed"
+                results[i] = self._create_error_result(
+                    keys[i], source, target_lang, "Translation failed"
                 )
 
-        # Return in original order
-        ordered_results = [results[key] for key in strings.keys()]
-        return ordered_results, stats
+        # Fan results out to the keys whose source was coalesced
+        for first, positions in duplicates.items():
+            result = results[first]
+            for i in positions:
+                results[i] = replace(result, key=keys[i])
+                if result.provider == "error":
+                    stats.failed_count += 1
+                    continue
+                if result.provider == "deepl":
+                    stats.deepl_count += 1
+                else:
+                    stats.gpt4_count += 1
+                self._update_quality_stats(stats, result.quality_score)
+
+        return results, stats
 
-    def _batch_translate_deepl(
+    async def translate_all_targets(
         self,
-        strings: Dict[str, str],
+        strings_by_lang: Dict[str, Dict[str, str]],
+        context: Optional[str] = None,
+        progress_callbacks: Optional[Dict[str, Callable[[int, int, str], None]]] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> Dict[str, tuple[List[TranslationResult], TranslationStats]]:
+        """
+        Translate several target languages concurrently.
+
+        One task per language is gathered so the API round trips of every
+        language overlap instead of running one language after another.
+
+        Args:
+            strings_by_lang: Dictionary of {target_lang: {key: source_text}}
+            context: Optional shared context for translations
+            progress_callbacks: Optional {target_lang: callback} for per-language progress
+            max_concurrency: Maximum API sub-batches in flight per language
+
+        Returns:
+            Dictionary of {target_lang: (list of results, statistics)}
+        """
+        progress_callbacks = progress_callbacks or {}
+        langs = list(strings_by_lang.keys())
+
+        outcomes = await asyncio.gather(*[
+            asyncio.create_task(
+                self.atranslate_batch(
+                    strings_by_lang[lang],
+                    lang,
+                    context,
+                    progress_callbacks.get(lang),
+                    max_concurrency,
+                )
+            )
+            for lang in langs
+        ])
+
+        return dict(zip(langs, outcomes))
+
+    async def _batch_translate_deepl(
+        self,
+        strings: Dict[int, str],
         target_lang: str,
         progress_callback: Optional[Callable],
         total_count: int,
-    ) -> Dict[str, tuple[str, str]]:
+        max_concurrency: int,
+    ) -> AsyncIterator[List[Tuple[int, str, str]]]:
         """
         Batch translate using DeepL API.
 
-        Returns:
-            Dict of {key: (source, translation)}
-        """
-        results = {}
-        keys = list(strings.keys())
-        texts = list(strings.values())
+        Sub-batches run concurrently, bounded by a semaphore; each is yielded
+        (and progress reported) as soon as it completes, so the caller can
+        process it while the others are still in flight.
 
-        batch_size = config.deepl_batch_size
+        Args:
+            strings: Dictionary of {position: source_text}
 
-        for i in range(0, len(texts), batch_size):
-            batch_keys = keys[i:i + batch_size]
-            batch_texts = texts[i:i + batch_size]
+        Yields:
+            List of (position, source, translation) for one sub-batch
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        completed = 0
+        # Strings outside this call (skipped, cached) already count as done
+        n = len(strings)
+        done_before = total_count - n
+
+        async def run_chunk(
+            positions: List[int], batch_texts: List[str]
+        ) -> List[Tuple[int, str, str]]:
+            async with semaphore, self._provider_semaphore("deepl"):
+                return await self._translate_deepl_chunk(positions, batch_texts, target_lang)
+
+        for chunk in asyncio.as_completed([
+            run_chunk(positions, batch_texts)
+            for positions, batch_texts in _chunk_items(strings, config.deepl_batch_size)
+        ]):
+            chunk_results = await chunk
 
-            try:
-                deepl_results = self.deepl.translate_batch(
-                    texts=batch_texts,
-                    target_lang=target_lang,
+            if progress_callback:
+                completed += len(chunk_results)
+                progress_callback(
+                    done_before + completed, total_count, f"DeepL: {completed}/{n}"
                 )
 
-                for key, text, result in zip(batch_keys, batch_texts, deepl_results):
-                    results[key] = (text, result.text)
+            yield chunk_results
 
-            except Exception:
-                # On batch failure, mark all as needing fallback (empty translation)
-                for key, text in zip(batch_keys, batch_texts):
-                    results[key] = (text, "")
-
-            if progress_callback:
-                completed = min(i + batch_size, len(texts))
-                progress_callback(completed, total_count, f"DeepL: {completed}/{len(texts)}")
+    async def _translate_deepl_chunk(
+        self,
+        positions: List[int],
+        batch_texts: List[str],
+        target_lang: str,
+    ) -> List[Tuple[int, str, str]]:
+        """Translate one DeepL sub-batch; failures map to empty translations."""
+        try:
+            deepl_results = await self.deepl.atranslate_batch(
+                texts=batch_texts,
+                target_lang=target_lang,
+            )
+            return [
+                (i, text, result.text)
+                for i, text, result in zip(positions, batch_texts, deepl_results)
+            ]
 
-        return results
+        except Exception:
+            # On batch failure, mark all as needing fallback (empty translation)
+            return [(i, text, "") for i, text in zip(positions, batch_texts)]
 
-    def _batch_translate_openai(
+    async def _batch_translate_openai(
         self,
-        strings: Dict[str, str],
+        strings: Dict[int, str],
         target_lang: str,
         context: Optional[str],
         progress_callback: Optional[Callable],
         total_count: int,
-    ) -> Dict[str, tuple[str, str]]:
+        max_concurrency: int,
+    ) -> List[Tuple[int, str, str]]:
         """
         Batch translate using OpenAI API with JSON format.
 
-        Returns:
-            Dict of {key: (source, translation)}
-        """
-        results = {}
-        keys = list(strings.keys())
-        texts = list(strings.values())
-
-        batch_size = config.openai_batch_size
+        Sub-batches run concurrently, bounded by a semaphore.
 
-        for i in range(0, len(texts), batch_size):
-            batch_keys = keys[i:i + batch_size]
-            batch_texts = texts[i:i + batch_size]
+        Args:
+            strings: Dictionary of {position: source_text}
 
-            try:
-                translations = self.openai.translate_batch(
-                    texts=batch_texts,
-                    target_lang=target_lang,
-                    context=context,
+        Returns:
+            List of (position, source, translation)
+        """
+        results: List[Tuple[int, str, str]] = []
+        semaphore = asyncio.Semaphore(max_concurrency)
+        completed = 0
+        # Strings outside this call (skipped, cached, accepted from DeepL)
+        # already count as done
+        n = len(strings)
+        done_before = total_count - n
+
+        async def run_chunk(
+            positions: List[int], batch_texts: List[str]
+        ) -> List[Tuple[int, str, str]]:
+            async with semaphore, self._provider_semaphore("openai"):
+                return await self._translate_openai_chunk(
+                    positions, batch_texts, target_lang, context
                 )
 
-                for key, text, translation in zip(batch_keys, batch_texts, translations):
-                    results[key] = (text, translation)
-
-            except Exception:
-                # On batch failure, try individual translations as final fallback
-                for key, text in zip(batch_keys, batch_texts):
-                    try:
-                        translation = self.openai.translate(
-                            text=text,
-                            target_lang=target_lang,
-                            context=context,
-                        )
-                        results[key] = (text, translation)
-                    except Exception:
-                        results[key] = (text, "")
+        for chunk in asyncio.as_completed([
+            run_chunk(positions, batch_texts)
+            for positions, batch_texts in _chunk_items(strings, config.openai_batch_size)
+        ]):
+            chunk_results = await chunk
+            results.extend(chunk_results)
 
             if progress_callback:
-                completed = min(i + batch_size, len(texts))
+                completed += len(chunk_results)
                 progress_callback(
-                    len(strings) - len(keys) + completed,
-                    total_count,
-                    f"GPT-4: {completed}/{len(texts)}"
+                    done_before + completed, total_count, f"GPT-4: {completed}/{n}"
                 )
 
         return results
 
+    async def _translate_openai_chunk(
+        self,
+        positions: List[int],
+        batch_texts: List[str],
+        target_lang: str,
+        context: Optional[str],
+    ) -> List[Tuple[int, str, str]]:
+        """Translate one OpenAI sub-batch, falling back to per-string calls."""
+        try:
+            translations = await self.openai.atranslate_batch(
+                texts=batch_texts,
+                target_lang=target_lang,
+                context=context,
+            )
+            return list(zip(positions, batch_texts, translations))
+
+        except Exception:
+            # On batch failure, try individual translations as final fallback
+            results = []
+            for i, text in zip(positions, batch_texts):
+                try:
+                    translation = await self.openai.atranslate(
+                        text=text,
+                        target_lang=target_lang,
+                        context=context,
+                    )
+                    results.append((i, text, translation))
+                except Exception:
+                    results.append((i, text, ""))
+            return results
+
     def _update_quality_stats(self, stats: TranslationStats, quality: QualityScore):
         """Update stats based on quality category."""
         if quality.category == "green":
@@ -405,6 +621,28 @@ class HybridTranslator:
         else:
             stats.red_count += 1
 
+    def _create_cached_result(
+        self, key: str, source: str, target_lang: str, hit: CachedTranslation
+    ) -> TranslationResult:
+        """Create a result from a translation cached by an earlier run."""
+        if hit.quality_json:
+            data = orjson.loads(hit.quality_json)
+            data["issues"] = tuple(data["issues"])
+            quality = QualityScore(**data)
+        else:
+            # Entries stored before full scores were cached are rescored locally
+            quality = self.scorer.score(source, hit.translation, target_lang)
+        return TranslationResult(
+            key=key,
+            source=source,
+            translation=hit.translation,
+            target_lang=target_lang,
+            quality_score=quality,
+            provider=hit.provider,
+            fallback_used=hit.provider == "gpt4",
+            cached=True,
+        )
+
     def _create_skip_result(
         self, key: str, source: str, target_lang: str
     ) -> TranslationResult:
@@ -414,15 +652,7 @@ class HybridTranslator:
             source=source,
             translation=source,
             target_lang=target_lang,
-            quality_score=QualityScore(
-                overall=100,
-                placeholder_score=100,
-                glossary_score=100,
-                length_score=100,
-                format_score=100,
-                category="green",
-                issues=[],
-            ),
+            quality_score=_SKIP_QUALITY,
             provider="skip",
             fallback_used=False,
         )
@@ -436,53 +666,76 @@ class HybridTranslator:
             source=source,
             translation="",
             target_lang=target_lang,
-            quality_score=QualityScore(
-                overall=0,
-                placeholder_score=0,
-                glossary_score=0,
-                length_score=0,
-                format_score=0,
-                category="red",
-                issues=[error],
-            ),
+            quality_score=_error_quality(error),
             provider="error",
             fallback_used=False,
             error=error,
         )
 
-    def _is_non_translatable(self, text: str) -> bool:
-        """Check if text should be skipped (symbols, numbers only, etc.)."""
-        # Strip whitespace
-        stripped = text.strip()
+    def _classify(self, source: str) -> Literal["translate", "skip"]:
+        """Decide whether a string is sent to the APIs or passed through as-is."""
+        return "skip" if _is_non_translatable(source) else "translate"
+
+    async def _non_translatable_flags(self, texts: List[str]) -> List[bool]:
+        """
+        Classify many texts with _is_non_translatable.
+
+        Batches of at least config.classify_process_threshold texts are split
+        across the shared worker processes and awaited, so the event loop
+        keeps serving other work meanwhile.
+        """
+        threshold = config.classify_process_threshold
+        if not threshold or len(texts) < threshold:
+            return _non_translatable_flags(texts)
+
+        chunk_size = 5000
+        loop = asyncio.get_running_loop()
+        pool = _classify_pool()
+        chunks = await asyncio.gather(*[
+            loop.run_in_executor(pool, _non_translatable_flags, texts[i:i + chunk_size])
+            for i in range(0, len(texts), chunk_size)
+        ])
+        return [flag for chunk in chunks for flag in chunk]
+
+
+def _is_non_translatable(text: str) -> bool:
+    """Check if text should be skipped (symbols, numbers only, etc.)."""
+    # Strip whitespace
+    stripped = text.strip()
 
-        # Empty strings
-        if not stripped:
-            return True
+    # Empty strings
+    if not stripped:
+        return True
 
-        # Single characters that are symbols
-        if len(stripped) == 1 and not stripped.isalpha():
-            return True
+    # Single characters that are symbols
+    if len(stripped) == 1 and not stripped.isalpha():
+        return True
 
-        # Pure numbers or percentages
-        if stripped.replace(".", "").replace(",", "").replace("%", "").isdigit():
-            return True
+    # Pure numbers or percentages
+    if stripped.replace(".", "").replace(",", "").replace("%", "").isdigit():
+        return True
 
-        # File extensions
-        if stripped.startswith(".") and len(stripped) <= 5:
-            return True
+    # Email addresses
+    if "@" in stripped and "." in stripped and " " not in stripped:
+        return True
 
-        # URLs
-        if stripped.startswith(("http://", "https://", "www.")):
-            return True
+    # File extensions, URLs and placeholders only
+    return _SKIP_RE.fullmatch(stripped) is not None
 
-        # Email addresses
-        if "@" in stripped and "." in stripped and " " not in stripped:
-            return True
 
-        # Placeholders only (e.g., "%@", "%lld")
-        import re
-        placeholder_only = re.fullmatch(r"[%@dlfs\d$\s\-/]+", stripped)
-        if placeholder_only:
-            return True
+def _non_translatable_flags(texts: List[str]) -> List[bool]:
+    """Classify a chunk of texts; module-level so worker processes can run it."""
+    return [_is_non_translatable(text) for text in texts]
 
-        return False
+
+@lru_cache(maxsize=1)
+def _classify_pool() -> ProcessPoolExecutor:
+    """
+    Get the process-wide worker pool for classifying large batches.
+
+    Started on first use and kept, so batches do not pay process startup
+    each time.
+    """
+    pool = ProcessPoolExecutor()
+    atexit.register(pool.shutdown)
+    return pool
@@ -1,14 +1,25 @@
 """LLM-based semantic quality reviewer for translations."""
 
+import asyncio
 import json
+import time
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
-from openai import OpenAI
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterable, List, Optional, Dict, Sequence, Tuple
+
+import orjson
 
 from ..config import config
+from ..translation.clients.openai_pool import shared_async_client, shared_client
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+    from ..cache import ReviewCache
 
-@dataclass
+_FAILED_PREFIX = "Review failed: "
+
+
+@dataclass(slots=True)
 class ReviewResult:
     """Result of LLM semantic review for a single translation."""
 
@@ -18,7 +29,7 @@ class ReviewResult:
     language: str
     semantic_score: float  # 0-100: Does it convey the same meaning?
     fluency_score: float  # 0-100: Is it grammatically correct and natural?
-    issues: List[str] = field(default_factory=list)
+    issues: Sequence[str] = ()
     suggested_fix: Optional[str] = None
 
     @property
@@ -37,7 +48,7 @@ class ReviewResult:
         return not self.passed or len(self.issues) > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewWithSuggestionsResult:
     """Result of LLM review with multiple translation suggestions."""
 
@@ -49,7 +60,7 @@ class ReviewWithSuggestionsResult:
     suggestions: List[Dict[str, str]] = field(default_factory=list)  # [{"text": "...", "explanation": "..."}]
 
 
-@dataclass
+@dataclass(slots=True)
 class BulkReviewItem:
     """Single item result from bulk review."""
 
@@ -74,28 +85,44 @@ class BulkReviewResult:
 class LLMReviewer:
     """Uses GPT to semantically review translations."""
 
-    LANGUAGE_NAMES = {
+    LANGUAGE_NAMES = MappingProxyType({
         "de": "German",
         "fr": "French",
         "it": "Italian",
         "es": "Spanish",
         "ro": "Romanian",
         "en": "English",
-    }
+    })
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional["ReviewCache"] = None,
+        client: Optional["OpenAI"] = None,
+        async_client: Optional["AsyncOpenAI"] = None,
+    ):
         """
         Initialize the LLM reviewer.
 
         Args:
             api_key: OpenAI API key. If not provided, uses OPENAI_API_KEY from environment.
+            cache: Optional review cache; unchanged translations are not re-reviewed
+            client: SDK client to send requests with (uses the shared pool if not provided)
+            async_client: Async SDK client (uses the shared per-loop pool if not provided)
         """
         self.api_key = api_key or config.openai_api_key
         if not self.api_key:
             raise ValueError("OpenAI API key is required for LLM review")
-        self.client = OpenAI(api_key=self.api_key)
+
+        self.client = client or shared_client(self.api_key)
         self.model = config.openai_model
         self.temperature = 0.2  # Lower temperature for more consistent evaluation
+        self.cache = cache
+        self._async_client = async_client
+
+    def _get_async_client(self) -> "AsyncOpenAI":
+        """Get the async client, shared with the translator unless one was injected."""
+        return self._async_client or shared_async_client(self.api_key)
 
     def review(
         self,
@@ -118,54 +145,147 @@ class LLMReviewer:
         Returns:
             ReviewResult with scores and issues
         """
-        lang_name = self.LANGUAGE_NAMES.get(target_lang.lower(), target_lang)
-
-        system_prompt = self._build_system_prompt(lang_name)
-        user_prompt = self._build_user_prompt(source, translation, lang_name, context)
+        if self.cache:
+            cache_key = self.cache.key(source, translation, target_lang, self.model, context)
+            cached = self.cache.get_many([cache_key]).get(cache_key)
+            if cached is not None:
+                return self._cached_review(cached, source, translation, target_lang, key)
 
         try:
             response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                max_completion_tokens=500,
-                response_format={"type": "json_object"},
+                **self._review_request(source, translation, target_lang, context)
             )
 
             result_text = response.choices[0].message.content.strip()
-            result_data = json.loads(result_text)
+            result = self._parse_review(result_text, source, translation, target_lang, key)
 
-            return ReviewResult(
-                key=key,
-                source=source,
-                translation=translation,
-                language=target_lang,
-                semantic_score=float(result_data.get("semantic_score", 0)),
-                fluency_score=float(result_data.get("fluency_score", 0)),
-                issues=result_data.get("issues", []),
-                suggested_fix=result_data.get("suggested_fix"),
+        except Exception as e:
+            # Return a result indicating review failed
+            return self._failed_review(source, translation, target_lang, key, str(e))
+
+        if self.cache:
+            self.cache.put_many([(cache_key, self._serialize_review(result))])
+        return result
+
+    async def areview(
+        self,
+        source: str,
+        translation: str,
+        target_lang: str,
+        key: str = "",
+        context: Optional[str] = None,
+    ) -> ReviewResult:
+        """Async version of review() using the async client."""
+        try:
+            response = await self._get_async_client().chat.completions.create(
+                **self._review_request(source, translation, target_lang, context)
             )
 
+            result_text = response.choices[0].message.content.strip()
+            return self._parse_review(result_text, source, translation, target_lang, key)
+
         except Exception as e:
             # Return a result indicating review failed
-            return ReviewResult(
-                key=key,
-                source=source,
-                translation=translation,
-                language=target_lang,
-                semantic_score=0,
-                fluency_score=0,
-                issues=[f"Review failed: {str(e)}"],
-                suggested_fix=None,
-            )
+            return self._failed_review(source, translation, target_lang, key, str(e))
+
+    def _review_request(
+        self,
+        source: str,
+        translation: str,
+        target_lang: str,
+        context: Optional[str],
+    ) -> dict:
+        """Build chat completion arguments for a single review."""
+        lang_name = self.LANGUAGE_NAMES.get(target_lang.lower(), target_lang)
+
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": self._build_system_prompt(lang_name)},
+                {
+                    "role": "user",
+                    "content": self._build_user_prompt(source, translation, lang_name, context),
+                },
+            ],
+            "max_completion_tokens": 500,
+            "response_format": {"type": "json_object"},
+        }
+
+    def _parse_review(
+        self,
+        result_text: str,
+        source: str,
+        translation: str,
+        target_lang: str,
+        key: str,
+    ) -> ReviewResult:
+        """Build a ReviewResult from the model's JSON response."""
+        result_data = orjson.loads(result_text)
+
+        return ReviewResult(
+            key=key,
+            source=source,
+            translation=translation,
+            language=target_lang,
+            semantic_score=float(result_data.get("semantic_score", 0)),
+            fluency_score=float(result_data.get("fluency_score", 0)),
+            issues=result_data.get("issues", []),
+            suggested_fix=result_data.get("suggested_fix"),
+        )
+
+    def _failed_review(
+        self,
+        source: str,
+        translation: str,
+        target_lang: str,
+        key: str,
+        error: str,
+    ) -> ReviewResult:
+        """Build a ReviewResult indicating the review could not be performed."""
+        return ReviewResult(
+            key=key,
+            source=source,
+            translation=translation,
+            language=target_lang,
+            semantic_score=0,
+            fluency_score=0,
+            issues=[f"{_FAILED_PREFIX}{error}"],
+            suggested_fix=None,
+        )
+
+    @staticmethod
+    def _serialize_review(result: ReviewResult) -> str:
+        """Serialize the model-provided fields of a review for the cache."""
+        return orjson.dumps({
+            "semantic_score": result.semantic_score,
+            "fluency_score": result.fluency_score,
+            "issues": list(result.issues),
+            "suggested_fix": result.suggested_fix,
+        }).decode("utf-8")
+
+    @staticmethod
+    def _cached_review(
+        result_json: str,
+        source: str,
+        translation: str,
+        target_lang: str,
+        key: str,
+    ) -> ReviewResult:
+        """Rebuild a ReviewResult from a cached review."""
+        return ReviewResult(
+            key=key,
+            source=source,
+            translation=translation,
+            language=target_lang,
+            **orjson.loads(result_json),
+        )
 
     def review_batch(
         self,
         translations: List[Dict[str, str]],
         target_lang: str,
         progress_callback=None,
+        batch_mode: bool = False,
     ) -> List[ReviewResult]:
         """
         Review multiple translations.
@@ -174,25 +294,335 @@ class LLMReviewer:
             translations: List of dicts with 'key', 'source', 'translation' keys
             target_lang: Target language code
             progress_callback: Optional callback(current, total, key) for progress updates
+            batch_mode: Submit all reviews through the OpenAI Batch API (cheaper,
+                        but completes asynchronously within 24h)
 
         Returns:
             List of ReviewResult objects
         """
-        results = []
+        if not batch_mode:
+            return asyncio.run(self.areview_batch(translations, target_lang, progress_callback))
+
+        # Only translations not reviewed before are submitted to the Batch API
+        cache_keys, results = self._cached_reviews(translations, target_lang)
+        pending = [i for i in range(len(translations)) if i not in results]
+        if pending:
+            reviews = self._review_batch_api(
+                [translations[i] for i in pending], target_lang, progress_callback
+            )
+            results.update(zip(pending, reviews))
+            self._store_reviews(cache_keys, zip(pending, reviews))
+
+        return [results[i] for i in range(len(translations))]
+
+    def _cached_reviews(
+        self,
+        translations: List[Dict[str, str]],
+        target_lang: str,
+    ) -> Tuple[List[bytes], Dict[int, ReviewResult]]:
+        """
+        Look up earlier reviews of the same translations with the same model.
+
+        Returns:
+            Tuple of (cache key per translation, {index: ReviewResult} for hits);
+            both empty when there is no cache
+        """
+        results: Dict[int, ReviewResult] = {}
+        if not self.cache:
+            return [], results
+
+        cache_keys = [
+            self.cache.key(t["source"], t["translation"], target_lang, self.model, t.get("context"))
+            for t in translations
+        ]
+        hits = self.cache.get_many(cache_keys)
+        for i, t in enumerate(translations):
+            if cache_keys[i] in hits:
+                results[i] = self._cached_review(
+                    hits[cache_keys[i]], t["source"], t["translation"],
+                    target_lang, t.get("key", ""),
+                )
+        return cache_keys, results
+
+    def _store_reviews(
+        self, cache_keys: List[bytes], reviewed: Iterable[Tuple[int, ReviewResult]]
+    ) -> None:
+        """Cache successful reviews, given as (index, ReviewResult) pairs."""
+        if self.cache:
+            self.cache.put_many(
+                (cache_keys[i], self._serialize_review(r))
+                for i, r in reviewed
+                if not (r.issues and r.issues[0].startswith(_FAILED_PREFIX))
+            )
+
+    async def areview_batch(
+        self,
+        translations: List[Dict[str, str]],
+        target_lang: str,
+        progress_callback=None,
+    ) -> List[ReviewResult]:
+        """
+        Review multiple translations, sending chunk requests concurrently.
+
+        Up to config.review_concurrency requests are in flight at once.
+
+        Args:
+            translations: List of dicts with 'key', 'source', 'translation' keys
+            target_lang: Target language code
+            progress_callback: Optional callback(current, total, key) for progress updates
+
+        Returns:
+            List of ReviewResult objects in the same order as translations
+        """
         total = len(translations)
+        chunk_size = config.review_batch_size
+        semaphore = asyncio.Semaphore(config.review_concurrency)
+
+        # Translations reviewed before with the same model come from the cache
+        cache_keys, results = self._cached_reviews(translations, target_lang)
+        if results and progress_callback:
+            progress_callback(len(results), total, "")
+
+        pending = [i for i in range(total) if i not in results]
+        completed = len(results)
+
+        # Review several translations per request so the system prompt and
+        # request overhead are shared across the chunk
+        async def run_chunk(indices: List[int]):
+            async with semaphore:
+                reviews = await self.areview_multi(
+                    [translations[i] for i in indices], target_lang
+                )
+            return indices, reviews
+
+        reviewed = []
+        for task in asyncio.as_completed([
+            run_chunk(pending[start:start + chunk_size])
+            for start in range(0, len(pending), chunk_size)
+        ]):
+            indices, reviews = await task
+            results.update(zip(indices, reviews))
+            reviewed.extend(zip(indices, reviews))
 
-        for i, item in enumerate(translations):
             if progress_callback:
-                progress_callback(i + 1, total, item.get("key", ""))
+                completed += len(reviews)
+                progress_callback(completed, total, reviews[-1].key)
+
+        self._store_reviews(cache_keys, reviewed)
+
+        return [results[i] for i in range(total)]
+
+    def review_multi(
+        self,
+        items: List[Dict[str, str]],
+        target_lang: str,
+    ) -> List[ReviewResult]:
+        """
+        Review several translations with a single request.
+
+        Args:
+            items: Up to config.review_batch_size dicts with 'key', 'source',
+                   'translation' and optional 'context' keys
+            target_lang: Target language code
 
-            result = self.review(
+        Returns:
+            List of ReviewResult objects in the same order as items
+        """
+        return asyncio.run(self.areview_multi(items, target_lang))
+
+    async def areview_multi(
+        self,
+        items: List[Dict[str, str]],
+        target_lang: str,
+    ) -> List[ReviewResult]:
+        """
+        Async version of review_multi().
+
+        Items missing from the response, or the whole chunk if the response
+        cannot be parsed, are reviewed one at a time instead.
+        """
+        if len(items) == 1:
+            item = items[0]
+            return [await self.areview(
                 source=item["source"],
                 translation=item["translation"],
                 target_lang=target_lang,
                 key=item.get("key", ""),
                 context=item.get("context"),
+            )]
+
+        lang_name = self.LANGUAGE_NAMES.get(target_lang.lower(), target_lang)
+
+        responses: Dict[str, Dict] = {}
+        try:
+            response = await self._get_async_client().chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": self._build_chunk_system_prompt(lang_name)},
+                    {"role": "user", "content": self._build_chunk_user_prompt(items, target_lang)},
+                ],
+                max_completion_tokens=config.openai_batch_max_tokens,
+                response_format={"type": "json_object"},
             )
-            results.append(result)
+
+            result_data = orjson.loads(response.choices[0].message.content.strip())
+            for review in result_data.get("results", []):
+                if isinstance(review, dict):
+                    responses[str(review.get("id", ""))] = review
+        except Exception:
+            pass
+
+        # Each answer is parsed on its own, so one malformed item only costs that item
+        parsed: Dict[int, ReviewResult] = {}
+        for i, item in enumerate(items):
+            review = responses.get(str(i))
+            if review is None:
+                continue
+            try:
+                parsed[i] = ReviewResult(
+                    key=item.get("key", ""),
+                    source=item["source"],
+                    translation=item["translation"],
+                    language=target_lang,
+                    semantic_score=float(review.get("semantic_score", 0)),
+                    fluency_score=float(review.get("fluency_score", 0)),
+                    issues=review.get("issues", []),
+                    suggested_fix=review.get("suggested_fix"),
+                )
+            except (TypeError, ValueError):
+                continue
+
+        # Items not answered (or not parseable) in the chunk fall back to
+        # single reviews, sent together
+        missing = [i for i in range(len(items)) if i not in parsed]
+        fallbacks = await asyncio.gather(*[
+            self.areview(
+                source=items[i]["source"],
+                translation=items[i]["translation"],
+                target_lang=target_lang,
+                key=items[i].get("key", ""),
+                context=items[i].get("context"),
+            )
+            for i in missing
+        ])
+        fallback_by_index = dict(zip(missing, fallbacks))
+
+        return [parsed[i] if i in parsed else fallback_by_index[i] for i in range(len(items))]
+
+    def _review_batch_api(
+        self,
+        translations: List[Dict[str, str]],
+        target_lang: str,
+        progress_callback=None,
+        poll_interval: float = 30.0,
+    ) -> List[ReviewResult]:
+        """
+        Review translations via the OpenAI Batch API.
+
+        Uploads one chat completion request per translation as a JSONL file,
+        polls the batch until it finishes and maps responses back by custom_id
+        (the item's index, since keys may be arbitrarily long). A batch still
+        running after config.review_batch_max_wait_seconds is cancelled and
+        its items are reported as failed reviews.
+        """
+        if not translations:
+            return []
+
+        lang_name = self.LANGUAGE_NAMES.get(target_lang.lower(), target_lang)
+        system_prompt = self._build_system_prompt(lang_name)
+        total = len(translations)
+
+        lines = []
+        for i, item in enumerate(translations):
+            lines.append(orjson.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {
+                            "role": "user",
+                            "content": self._build_user_prompt(
+                                item["source"], item["translation"], lang_name, item.get("context")
+                            ),
+                        },
+                    ],
+                    "max_completion_tokens": 500,
+                    "response_format": {"type": "json_object"},
+                },
+            }))
+
+        try:
+            input_file = self.client.files.create(
+                file=("reviews.jsonl", b"\n".join(lines)),
+                purpose="batch",
+            )
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+
+            deadline = time.monotonic() + config.review_batch_max_wait_seconds
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if time.monotonic() >= deadline:
+                    # Stop paying for a batch nobody will collect
+                    self.client.batches.cancel(batch.id)
+                    raise TimeoutError(
+                        f"Batch {batch.id} still '{batch.status}' after "
+                        f"{config.review_batch_max_wait_seconds:g}s; cancelled"
+                    )
+                if progress_callback:
+                    completed = batch.request_counts.completed if batch.request_counts else 0
+                    progress_callback(completed, total, f"Batch {batch.status}")
+                time.sleep(min(poll_interval, max(0.0, deadline - time.monotonic())))
+                batch = self.client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise RuntimeError(f"Batch {batch.id} ended with status '{batch.status}'")
+
+            output = self.client.files.content(batch.output_file_id).text
+        except Exception as e:
+            return [
+                self._failed_review(
+                    item["source"], item["translation"], target_lang, item.get("key", ""), str(e)
+                )
+                for item in translations
+            ]
+
+        # Map responses back to their original items
+        responses: Dict[str, str] = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            body = (record.get("response") or {}).get("body") or {}
+            choices = body.get("choices") or []
+            if choices:
+                responses[record["custom_id"]] = choices[0]["message"]["content"]
+
+        results = []
+        for i, item in enumerate(translations):
+            key = item.get("key", "")
+            content = responses.get(str(i))
+            if content is None:
+                results.append(self._failed_review(
+                    item["source"], item["translation"], target_lang, key, "No response in batch output"
+                ))
+                continue
+            try:
+                results.append(self._parse_review(
+                    content.strip(), item["source"], item["translation"], target_lang, key
+                ))
+            except Exception as e:
+                results.append(self._failed_review(
+                    item["source"], item["translation"], target_lang, key, str(e)
+                ))
+
+        if progress_callback:
+            progress_callback(total, total, "Batch complete")
 
         return results
 
@@ -250,6 +680,59 @@ TRANSLATION ({lang_name}):
 
         return prompt
 
+    def _build_chunk_system_prompt(self, lang_name: str) -> str:
+        """Build the system prompt for reviewing several translations at once."""
+        return f"""You are an expert translator and quality reviewer for {lang_name} translations in a mobile app context.
+
+You will receive several numbered translations separated by "---". Evaluate EACH one and provide:
+1. A semantic accuracy score (0-100): Does the translation convey the exact same meaning as the source?
+2. A fluency score (0-100): Is the translation grammatically correct and natural-sounding in {lang_name}?
+3. A list of specific issues found (empty if none)
+4. A suggested fix if there are issues (null if translation is good)
+
+IMPORTANT GUIDELINES:
+- Review each item independently
+- Focus on meaning preservation - minor phrasing differences are OK if meaning is preserved
+- Consider mobile UI context - translations should be concise
+- iOS format specifiers (%@, %d, %1$@, etc.) should be preserved but their position can change
+- Be strict about semantic errors (wrong meaning, omissions, additions)
+- Be lenient about stylistic differences
+
+RESPONSE FORMAT (JSON only, one result per item, id is the item number):
+{{
+  "results": [
+    {{
+      "id": <item number>,
+      "semantic_score": <0-100>,
+      "fluency_score": <0-100>,
+      "issues": ["issue 1", "issue 2"],
+      "suggested_fix": "<corrected translation or null>"
+    }}
+  ]
+}}
+
+Score guidelines:
+- 95-100: Perfect or near-perfect translation
+- 80-94: Good translation with minor issues
+- 60-79: Acceptable but needs improvement
+- Below 60: Significant problems, needs retranslation"""
+
+    def _build_chunk_user_prompt(
+        self,
+        items: List[Dict[str, str]],
+        target_lang: str,
+    ) -> str:
+        """Build the user prompt listing numbered translations to review."""
+        lang_code = target_lang.upper()
+        blocks = []
+        for i, item in enumerate(items):
+            block = f"[{i}] EN: {item['source']}\n{lang_code}: {item['translation']}"
+            if item.get("context"):
+                block += f"\nCONTEXT: {item['context']}"
+            blocks.append(block)
+
+        return "Review these translations:\n\n" + "\n---\n".join(blocks) + "\n\nProvide your evaluation as JSON."
+
     def review_with_suggestions(
         self,
         source: str,
@@ -290,7 +773,7 @@ TRANSLATION ({lang_name}):
             )
 
             result_text = response.choices[0].message.content.strip()
-            result_data = json.loads(result_text)
+            result_data = orjson.loads(result_text)
 
             return ReviewWithSuggestionsResult(
                 key=key,
@@ -430,7 +913,7 @@ CURRENT TRANSLATION ({lang_name}):
                 )
 
                 result_text = response.choices[0].message.content.strip()
-                result_data = json.loads(result_text)
+                result_data = orjson.loads(result_text)
 
                 # Parse results - only flagged items are returned
                 flagged = result_data.get("flagged", [])
@@ -1,13 +1,18 @@
 """Validator for iOS format specifier placeholders."""
 
 import re
+from functools import lru_cache
 from typing import List, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlaceholderIssue:
-    """Represents a placeholder validation issue."""
+    """
+    Represents a placeholder validation issue.
+
+    Immutable, since validation results are cached and shared between callers.
+    """
 
     error_type: str  # missing, extra, mismatch, order_changed
     message: str
@@ -28,17 +33,21 @@ class PlaceholderValidator:
 
     # Regex pattern for iOS format specifiers
     # Matches: %[-+0 #]*[width][.precision][length]type or %n$type (positional)
+    # The width cannot start with 0 (leading zeros are the 0 flag), so no run
+    # of characters can be split between two quantifiers; otherwise
+    # backtracking on input like "%0000..." would be quadratic
     PLACEHOLDER_PATTERN = re.compile(
         r"%"  # Start with %
         r"(?:"
-        r"(?P<positional>\d+\$)?"  # Optional positional specifier (e.g., 1$)
+        r"(?:\d+\$)?"  # Optional positional specifier (e.g., 1$)
         r"[-+0 #]*"  # Optional flags
-        r"(?:\d+|\*)?"  # Optional width
+        r"(?:[1-9]\d*|\*)?"  # Optional width
         r"(?:\.(?:\d+|\*))?"  # Optional precision
         r"(?:hh|h|ll|l|L|z|j|t)?"  # Optional length modifier
         r"[diouxXeEfFgGaAcspn@]"  # Conversion specifier
         r"|%"  # OR literal %% (escaped percent)
-        r")"
+        r")",
+        re.ASCII,  # Format specifiers only take ASCII digits
     )
 
     def validate(self, source: str, translation: str) -> Tuple[bool, List[PlaceholderIssue]]:
@@ -52,10 +61,45 @@ class PlaceholderValidator:
         Returns:
             Tuple of (is_valid, list of issues)
         """
-        issues = []
+        is_valid, issues = self._compare(
+            self._extract_placeholders(source), self._extract_placeholders(translation)
+        )
+        return is_valid, list(issues)
 
-        source_placeholders = self._extract_placeholders(source)
-        trans_placeholders = self._extract_placeholders(translation)
+    def validate_many(
+        self, pairs: List[Tuple[str, str]]
+    ) -> List[Tuple[bool, List[PlaceholderIssue]]]:
+        """
+        Validate many (source, translation) pairs at once.
+
+        Equivalent to calling validate() on each pair, but placeholders are
+        extracted with two scans over whole batches (see extract_many()).
+
+        Args:
+            pairs: List of (source, translation)
+
+        Returns:
+            List of (is_valid, list of issues), in input order
+        """
+        sources = self.extract_many([source for source, _ in pairs])
+        translations = self.extract_many([translation for _, translation in pairs])
+        results = []
+        for source_placeholders, trans_placeholders in zip(sources, translations):
+            is_valid, issues = self._compare(source_placeholders, trans_placeholders)
+            results.append((is_valid, list(issues)))
+        return results
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _compare(
+        source_placeholders: Tuple[str, ...], trans_placeholders: Tuple[str, ...]
+    ) -> Tuple[bool, Tuple[PlaceholderIssue, ...]]:
+        """Compare extracted placeholders; cached, since few distinct placeholder sets occur."""
+        # Identical placeholders (including none at all) is by far the common case
+        if source_placeholders == trans_placeholders:
+            return True, ()
+
+        issues = []
 
         # Check count mismatch
         if len(source_placeholders) != len(trans_placeholders):
@@ -68,12 +112,8 @@ class PlaceholderValidator:
                 )
             )
 
-        # Check for missing placeholders
-        source_set = set(source_placeholders)
-        trans_set = set(trans_placeholders)
-
-        missing = source_set - trans_set
-        extra = trans_set - source_set
+        # Check for missing and extra placeholders
+        missing, extra = PlaceholderValidator._sorted_diff(source_placeholders, trans_placeholders)
 
         for placeholder in missing:
             issues.append(
@@ -111,21 +151,106 @@ class PlaceholderValidator:
                     )
 
         is_valid = not any(issue.severity == "critical" for issue in issues)
-        return is_valid, issues
+        return is_valid, tuple(issues)
 
-    def _extract_placeholders(self, text: str) -> List[str]:
-        """Extract all placeholders from text."""
-        matches = self.PLACEHOLDER_PATTERN.findall(text)
-        # The regex returns the full match, rebuild them
+    @staticmethod
+    def _sorted_diff(source: Tuple[str, ...], trans: Tuple[str, ...]) -> Tuple[List[str], List[str]]:
+        """
+        Compare placeholder lists as sets without building any sets.
+
+        Strings hold only a handful of placeholders, so sorting both lists and
+        walking them in step is cheaper than hashing everything into sets, and
+        the issues come out in a stable order.
+
+        Returns:
+            Tuple of (distinct placeholders only in source, only in trans), sorted
+        """
+        a = sorted(source)
+        b = sorted(trans)
+        missing: List[str] = []
+        extra: List[str] = []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if a[i] == b[j]:
+                value = a[i]
+                while i < len(a) and a[i] == value:
+                    i += 1
+                while j < len(b) and b[j] == value:
+                    j += 1
+            elif a[i] < b[j]:
+                if not missing or missing[-1] != a[i]:
+                    missing.append(a[i])
+                i += 1
+            else:
+                if not extra or extra[-1] != b[j]:
+                    extra.append(b[j])
+                j += 1
+        for value in a[i:]:
+            if not missing or missing[-1] != value:
+                missing.append(value)
+        for value in b[j:]:
+            if not extra or extra[-1] != value:
+                extra.append(value)
+        return missing, extra
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _extract_placeholders(text: str) -> Tuple[str, ...]:
+        """Extract all placeholders from text (cached per text)."""
+        # Every specifier starts with %, which is rare in UI text: str.find
+        # skips to each one at C speed and the pattern only parses the short
+        # specifier there, instead of the regex engine walking every character
+        match = PlaceholderValidator.PLACEHOLDER_PATTERN.match
         placeholders = []
-        for match in self.PLACEHOLDER_PATTERN.finditer(text):
-            placeholders.append(match.group(0))
-        return placeholders
+        i = text.find("%")
+        while i != -1:
+            m = match(text, i)
+            if m:
+                placeholders.append(m.group(0))
+                i = text.find("%", m.end())
+            else:
+                i = text.find("%", i + 1)
+        return tuple(placeholders)
+
+    def extract_many(self, texts: List[str]) -> List[Tuple[str, ...]]:
+        """
+        Extract the placeholders of many texts with a single regex scan.
+
+        The texts are joined with a separator that no placeholder can contain,
+        so one finditer over the joined buffer replaces a scan per text and
+        each match is assigned back to its text by offset.
+
+        Args:
+            texts: Texts to extract from
+
+        Returns:
+            Placeholders of each text, in input order
+        """
+        buffer = "\x00".join(texts)
+        ends = []
+        end = -1
+        for text in texts:
+            end += len(text) + 1
+            ends.append(end)
+
+        placeholders: List[List[str]] = [[] for _ in texts]
+        index = 0
+        # Matches come in buffer order, so the owning text only moves forward
+        for match in self.PLACEHOLDER_PATTERN.finditer(buffer):
+            while match.start() >= ends[index]:
+                index += 1
+            placeholders[index].append(match.group(0))
+        return [tuple(found) for found in placeholders]
 
     def get_placeholder_count(self, text: str) -> int:
         """Get the number of placeholders in text."""
-        return len(self._extract_placeholders(text))
+        if "%" not in text:
+            return 0
+        return sum(1 for _ in self.PLACEHOLDER_PATTERN.finditer(text))
 
     def has_placeholders(self, text: str) -> bool:
         """Check if text contains any placeholders."""
+        # str.__contains__ finds a single character with memchr, far cheaper than a regex scan
+        if "%" not in text:
+            return False
         return bool(self.PLACEHOLDER_PATTERN.search(text))
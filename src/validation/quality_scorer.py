@@ -1,9 +1,64 @@
 """Quality scoring system for translations."""
 
-from typing import List, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import List, Dict, FrozenSet, NamedTuple, Optional, Set, Tuple
 
 from ..models.translation_result import QualityScore
-from .placeholder_validator import PlaceholderValidator
+from .placeholder_validator import PlaceholderIssue, PlaceholderValidator
+
+# PlaceholderValidator is stateless, so every scorer shares one instance
+_PLACEHOLDER_VALIDATOR = PlaceholderValidator()
+
+
+class TextStats(NamedTuple):
+    """Layout features of one text, used by the length and format checks."""
+
+    length: int
+    newlines: int
+    leading_space: bool
+    trailing_space: bool
+    double_space: bool
+
+
+@lru_cache(maxsize=16384)
+def _scan(text: str) -> TextStats:
+    """Collect a text's layout features once (a source is reused for every language)."""
+    return TextStats(
+        length=len(text),
+        newlines=text.count("\n"),
+        leading_space=text.startswith(" "),
+        trailing_space=text.endswith(" "),
+        double_space="  " in text,
+    )
+
+
+@lru_cache(maxsize=64)
+def _terms_automaton(terms: Tuple[str, ...]):
+    """Build an Aho-Corasick automaton over lowercased terms, or None without pyahocorasick."""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        lowered = term.lower()
+        if lowered:
+            automaton.add_word(lowered, lowered)
+    automaton.make_automaton()
+    return automaton
+
+
+def _present_terms(text_lower: str, terms: Tuple[str, ...]) -> Set[str]:
+    """Get the lowercased terms that occur in text_lower (substring match, overlaps allowed)."""
+    automaton = _terms_automaton(terms)
+    if automaton is None:
+        return {term.lower() for term in terms if term.lower() in text_lower}
+
+    # One pass over the text finds every term, instead of one scan per term
+    present = {lowered for _, lowered in automaton.iter(text_lower)}
+    present.add("")  # An empty term occurs in every text, as with `in`
+    return present
 
 
 class QualityScorer:
@@ -31,7 +86,14 @@ class QualityScorer:
                      Format: {source_term: {lang_code: translation}}
         """
         self.glossary = glossary or {}
-        self.placeholder_validator = PlaceholderValidator()
+        self.placeholder_validator = _PLACEHOLDER_VALIDATOR
+        # Computed once here rather than by walking the glossary on every score
+        self._supported_langs = frozenset(
+            lang
+            for translations in self.glossary.values()
+            if isinstance(translations, dict)
+            for lang in translations
+        )
 
     def score(
         self,
@@ -54,11 +116,65 @@ class QualityScorer:
         Returns:
             QualityScore with detailed breakdown
         """
+        return self._score(
+            source, translation, target_lang, max_length_ratio, required_glossary_terms
+        )
+
+    def score_many(
+        self,
+        pairs: List[Tuple[str, str]],
+        target_lang: str,
+        max_length_ratio: float = 1.5,
+        required_glossary_terms: Optional[List[str]] = None,
+    ) -> List[QualityScore]:
+        """
+        Score many translations at once, e.g. a whole strings file.
+
+        Gives the same scores as calling score() on each pair, but the
+        placeholders of all pairs are extracted in batch scans.
+
+        Args:
+            pairs: List of (source, translation)
+            target_lang: Target language code
+            max_length_ratio: Maximum acceptable translation/source length ratio
+            required_glossary_terms: List of terms that must use glossary translations
+
+        Returns:
+            List of QualityScore, in input order
+        """
+        validations = self.placeholder_validator.validate_many(pairs)
+        return [
+            self._score(
+                source, translation, target_lang, max_length_ratio,
+                required_glossary_terms, validation,
+            )
+            for (source, translation), validation in zip(pairs, validations)
+        ]
+
+    def _score(
+        self,
+        source: str,
+        translation: str,
+        target_lang: str,
+        max_length_ratio: float,
+        required_glossary_terms: Optional[List[str]],
+        validation: Optional[Tuple[bool, List[PlaceholderIssue]]] = None,
+    ) -> QualityScore:
+        """Score a translation, optionally from an already computed placeholder validation."""
         issues = []
 
+        # An untranslated string (brand name, number, ISO code) trivially keeps
+        # its placeholders and layout, so only the glossary and length are checked
+        identical = source == translation
+
         # 1. Placeholder validation (40% weight) - CRITICAL
-        placeholder_score, ph_issues = self._score_placeholders(source, translation)
-        issues.extend(ph_issues)
+        if identical:
+            placeholder_score = 100.0
+        else:
+            placeholder_score, ph_issues = self._score_placeholders(
+                source, translation, validation
+            )
+            issues.extend(ph_issues)
 
         # 2. Glossary compliance (25% weight)
         glossary_score, gl_issues = self._score_glossary(
@@ -66,13 +182,21 @@ class QualityScorer:
         )
         issues.extend(gl_issues)
 
+        source_stats = _scan(source)
+        trans_stats = source_stats if identical else _scan(translation)
+
         # 3. Length appropriateness (20% weight)
-        length_score, len_issues = self._score_length(source, translation, max_length_ratio)
+        length_score, len_issues = self._score_length(
+            source_stats.length, trans_stats.length, max_length_ratio
+        )
         issues.extend(len_issues)
 
         # 4. Format preservation (15% weight)
-        format_score, fmt_issues = self._score_format(source, translation)
-        issues.extend(fmt_issues)
+        if identical:
+            format_score = 100.0
+        else:
+            format_score, fmt_issues = self._score_format(source_stats, trans_stats)
+            issues.extend(fmt_issues)
 
         # Calculate weighted overall score
         overall = (
@@ -100,14 +224,61 @@ class QualityScorer:
             length_score=length_score,
             format_score=format_score,
             category=category,
-            issues=issues,
+            issues=tuple(issues),
         )
 
+    def fast_gate(
+        self,
+        source: str,
+        translation: str,
+        min_overall: float = 0.0,
+        max_length_ratio: float = 1.5,
+    ) -> bool:
+        """
+        Cheaply check whether a translation can be accepted at all.
+
+        Runs only the placeholder and length checks. False means score() is
+        certain to rate the translation red or below min_overall, so the full
+        score can be skipped; True means it still has to be scored.
+
+        Args:
+            source: Original source text
+            translation: Translated text
+            min_overall: Overall score the translation must reach
+            max_length_ratio: Maximum acceptable translation/source length ratio
+
+        Returns:
+            False if the translation is certain to be rejected
+        """
+        # A missing, extra or miscounted placeholder is critical, which is always red
+        if "%" in source or "%" in translation:
+            extract = self.placeholder_validator._extract_placeholders
+            source_placeholders = extract(source)
+            trans_placeholders = extract(translation)
+            if (
+                len(source_placeholders) != len(trans_placeholders)
+                or set(source_placeholders) != set(trans_placeholders)
+            ):
+                return False
+
+        # Every other component can contribute at most its full weight
+        length_score, _ = self._score_length(len(source), len(translation), max_length_ratio)
+        return 80.0 + length_score * 0.20 >= min_overall
+
     def _score_placeholders(
-        self, source: str, translation: str
+        self,
+        source: str,
+        translation: str,
+        validation: Optional[Tuple[bool, List[PlaceholderIssue]]] = None,
     ) -> Tuple[float, List[str]]:
-        """Score placeholder preservation."""
-        is_valid, issues = self.placeholder_validator.validate(source, translation)
+        """Score placeholder preservation, validating the pair unless validation is given."""
+        if validation is None:
+            # Every placeholder starts with %, so most UI strings need no parsing
+            if "%" not in source and "%" not in translation:
+                return 100.0, []
+            validation = self.placeholder_validator.validate(source, translation)
+
+        is_valid, issues = validation
 
         if is_valid and not issues:
             return 100.0, []
@@ -140,9 +311,10 @@ class QualityScorer:
 
         source_lower = source.lower()
         translation_lower = translation.lower()
+        present = _present_terms(source_lower, tuple(required_terms))
 
         for term in required_terms:
-            if term.lower() in source_lower:
+            if term.lower() in present:
                 total_required += 1
                 expected = self._get_glossary_translation(term, target_lang)
 
@@ -159,62 +331,62 @@ class QualityScorer:
         score = (matched / total_required) * 100
         return score, issues
 
+    @staticmethod
+    @lru_cache(maxsize=8192)
     def _score_length(
-        self, source: str, translation: str, max_ratio: float
-    ) -> Tuple[float, List[str]]:
-        """Score translation length appropriateness."""
-        if not source or not translation:
-            return 100.0, []
+        source_length: int, trans_length: int, max_ratio: float
+    ) -> Tuple[float, Tuple[str, ...]]:
+        """Score translation length appropriateness (cached per pair of lengths)."""
+        if not source_length or not trans_length:
+            return 100.0, ()
 
-        ratio = len(translation) / len(source)
+        ratio = trans_length / source_length
 
         if ratio <= max_ratio:
-            return 100.0, []
+            return 100.0, ()
         elif ratio <= max_ratio * 1.25:
-            return 80.0, [f"Translation is {ratio:.1f}x longer than source"]
+            return 80.0, (f"Translation is {ratio:.1f}x longer than source",)
         elif ratio <= max_ratio * 1.5:
-            return 60.0, [f"Translation is significantly longer ({ratio:.1f}x)"]
+            return 60.0, (f"Translation is significantly longer ({ratio:.1f}x)",)
         else:
-            return 40.0, [f"Translation is too long ({ratio:.1f}x source length)"]
-
-    def _score_format(self, source: str, translation: str) -> Tuple[float, List[str]]:
-        """Score format preservation (whitespace, newlines, etc.)."""
+            return 40.0, (f"Translation is too long ({ratio:.1f}x source length)",)
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _score_format(
+        source: TextStats, translation: TextStats
+    ) -> Tuple[float, Tuple[str, ...]]:
+        """Score format preservation (whitespace, newlines, etc.), cached per pair of stats."""
         issues = []
         score = 100.0
 
         # Check newline preservation
-        source_newlines = source.count("\n")
-        trans_newlines = translation.count("\n")
-        if source_newlines != trans_newlines:
+        if source.newlines != translation.newlines:
             score -= 20
             issues.append(
-                f"Newline count changed: {source_newlines} → {trans_newlines}"
+                f"Newline count changed: {source.newlines} → {translation.newlines}"
             )
 
         # Check leading whitespace
-        if source.startswith(" ") != translation.startswith(" "):
+        if source.leading_space != translation.leading_space:
             score -= 10
             issues.append("Leading whitespace changed")
 
         # Check trailing whitespace
-        if source.endswith(" ") != translation.endswith(" "):
+        if source.trailing_space != translation.trailing_space:
             score -= 10
             issues.append("Trailing whitespace changed")
 
         # Check for double spaces (common translation artifact)
-        if "  " not in source and "  " in translation:
+        if not source.double_space and translation.double_space:
             score -= 5
             issues.append("Double spaces introduced")
 
-        return max(0, score), issues
+        return max(0, score), tuple(issues)
 
-    def _get_supported_glossary_langs(self) -> List[str]:
-        """Get list of languages with glossary entries."""
-        langs = set()
-        for translations in self.glossary.values():
-            if isinstance(translations, dict):
-                langs.update(translations.keys())
-        return list(langs)
+    def _get_supported_glossary_langs(self) -> FrozenSet[str]:
+        """Get the languages with glossary entries."""
+        return self._supported_langs
 
     def _get_glossary_translation(
         self, term: str, target_lang: str
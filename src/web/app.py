@@ -3,6 +3,7 @@
 import uvicorn
 from pathlib import Path
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
@@ -11,6 +12,8 @@ from .services.file_storage import FileStorage
 from .services.job_manager import JobManager
 from .services.direct_file_service import DirectFileService
 from .services.review_history import ReviewHistoryService
+from .services.translate_batcher import TranslateBatcher
+from .services.translation_service import TranslationService
 
 # Paths
 BASE_DIR = Path(__file__).parent
@@ -20,8 +23,10 @@ STATIC_DIR = BASE_DIR / "static"
 # Global services
 file_storage = FileStorage()
 job_manager = JobManager()
-direct_file_service = DirectFileService(file_storage)
+translation_service = TranslationService()
+direct_file_service = DirectFileService(file_storage, translation_service)
 review_history = ReviewHistoryService(file_storage.base_dir)
+translate_batcher = TranslateBatcher()
 
 
 def create_app() -> FastAPI:
@@ -30,6 +35,7 @@ def create_app() -> FastAPI:
         title="MintDeck Localizer",
         description="iOS Localization Pipeline Web UI",
         version="0.1.0",
+        default_response_class=ORJSONResponse,
     )
 
     # Mount static files
@@ -44,6 +50,8 @@ def create_app() -> FastAPI:
     app.state.job_manager = job_manager
     app.state.direct_file_service = direct_file_service
     app.state.review_history = review_history
+    app.state.translation_service = translation_service
+    app.state.translate_batcher = translate_batcher
 
     # Include routers
     app.include_router(pages.router)
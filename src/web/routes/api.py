@@ -3,10 +3,9 @@
 import asyncio
 from typing import Optional
 from fastapi import APIRouter, Request, UploadFile, File, HTTPException
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
-from ..services.translation_service import TranslationService
 from ..services.job_manager import JobStatus
 
 router = APIRouter()
@@ -70,21 +69,21 @@ async def upload_file(request: Request, file: UploadFile = File(...)):
     if not file.filename.endswith(".xcstrings"):
         raise HTTPException(400, "File must be a .xcstrings file")
 
-    # Read and save content
-    content = await file.read()
+    # Stream the upload to storage in chunks instead of reading it into memory
+    await file.seek(0)
+    metadata = await asyncio.to_thread(file_storage.save_file, file.file, file.filename)
 
-    # Validate JSON
+    # A single parse of the stored file both validates the JSON and gives the stats
+    service = request.app.state.translation_service
     try:
-        import json
-        json.loads(content)
-    except json.JSONDecodeError:
+        stats = await asyncio.to_thread(
+            service.get_file_stats_for_path, file_storage.get_file_path(metadata.file_id)
+        )
+    except ValueError:
+        file_storage.delete(metadata.file_id)
         raise HTTPException(400, "Invalid JSON in file")
-
-    metadata = file_storage.save(content, file.filename)
-
-    # Get stats
-    service = TranslationService()
-    stats = service.get_file_stats(content.decode("utf-8"))
+    # The page requests the same stats right after uploading
+    file_storage.put_derived(metadata.file_id, "stats", stats)
 
     return {
         "file_id": metadata.file_id,
@@ -95,7 +94,7 @@ async def upload_file(request: Request, file: UploadFile = File(...)):
 
 
 @router.get("/files/{file_id}")
-async def get_file_info(request: Request, file_id: str):
+def get_file_info(request: Request, file_id: str):
     """Get file metadata and stats."""
     file_storage = request.app.state.file_storage
 
@@ -103,9 +102,8 @@ async def get_file_info(request: Request, file_id: str):
     if not metadata:
         raise HTTPException(404, "File not found")
 
-    content = file_storage.get_content_string(file_id)
-    service = TranslationService()
-    stats = service.get_file_stats(content)
+    service = request.app.state.translation_service
+    stats = file_storage.get_derived(file_id, "stats", service.get_file_stats)
 
     return {
         "file_id": metadata.file_id,
@@ -117,7 +115,7 @@ async def get_file_info(request: Request, file_id: str):
 
 
 @router.get("/files/{file_id}/download")
-async def download_file(request: Request, file_id: str):
+def download_file(request: Request, file_id: str):
     """Download the processed file."""
     file_storage = request.app.state.file_storage
 
@@ -125,19 +123,31 @@ async def download_file(request: Request, file_id: str):
     if not metadata:
         raise HTTPException(404, "File not found")
 
-    content = file_storage.get_content(file_id)
+    # Taken before the file is opened, so a concurrent edit can only pair
+    # the streamed content with an older ETag, never a newer one
+    etag = file_storage.get_etag(file_id)
+    if etag is None:
+        raise HTTPException(404, "File not found")
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers=headers)
+
+    # Streamed in chunks so large files are never held in memory whole
+    content = file_storage.iter_content(file_id)
+    if content is None:
+        raise HTTPException(404, "File not found")
 
-    return Response(
-        content=content,
-        media_type="application/json",
-        headers={
-            "Content-Disposition": f'attachment; filename="{metadata.original_name}"'
-        }
-    )
+    headers["Content-Disposition"] = f'attachment; filename="{metadata.original_name}"'
+    return StreamingResponse(content, media_type="application/json", headers=headers)
 
 
 @router.delete("/files/{file_id}")
-async def delete_file(request: Request, file_id: str):
+def delete_file(request: Request, file_id: str):
     """Delete an uploaded file."""
     file_storage = request.app.state.file_storage
 
@@ -149,47 +159,45 @@ async def delete_file(request: Request, file_id: str):
 
 # Stats endpoints
 @router.get("/stats/{file_id}")
-async def get_stats(request: Request, file_id: str):
+def get_stats(request: Request, file_id: str):
     """Get statistics for a file."""
     file_storage = request.app.state.file_storage
 
-    content = file_storage.get_content_string(file_id)
-    if not content:
+    service = request.app.state.translation_service
+    stats = file_storage.get_derived(file_id, "stats", service.get_file_stats)
+    if stats is None:
         raise HTTPException(404, "File not found")
 
-    service = TranslationService()
-    stats = service.get_file_stats(content)
-
     return stats
 
 
 @router.get("/stats/{file_id}/untranslated/{language}")
-async def get_untranslated(request: Request, file_id: str, language: str):
+def get_untranslated(request: Request, file_id: str, language: str):
     """Get untranslated strings for a language."""
     file_storage = request.app.state.file_storage
 
-    content = file_storage.get_content_string(file_id)
-    if not content:
+    service = request.app.state.translation_service
+    untranslated = file_storage.get_derived(
+        file_id,
+        ("untranslated", language),
+        lambda content: service.get_untranslated_keys(content, language),
+    )
+    if untranslated is None:
         raise HTTPException(404, "File not found")
 
-    service = TranslationService()
-    untranslated = service.get_untranslated_keys(content, language)
-
     return {"language": language, "untranslated": untranslated}
 
 
 @router.get("/stats/{file_id}/untranslated-count")
-async def get_untranslated_count(request: Request, file_id: str):
+def get_untranslated_count(request: Request, file_id: str):
     """Get total count of untranslated strings across all languages."""
     file_storage = request.app.state.file_storage
 
-    content = file_storage.get_content_string(file_id)
-    if not content:
+    service = request.app.state.translation_service
+    stats = file_storage.get_derived(file_id, "stats", service.get_file_stats)
+    if stats is None:
         raise HTTPException(404, "File not found")
 
-    service = TranslationService()
-    stats = service.get_file_stats(content)
-
     # Calculate total untranslated across all languages
     total_untranslated = 0
     languages_with_missing = {}
@@ -230,6 +238,7 @@ async def start_translation(request: Request, file_id: str, body: TranslateReque
             file_storage,
             job_manager,
             direct_service,
+            request.app.state.translation_service,
             job.job_id,
             file_id,
             body.languages,
@@ -240,10 +249,21 @@ async def start_translation(request: Request, file_id: str, body: TranslateReque
     return {"job_id": job.job_id}
 
 
+def _store_job_output(file_storage, direct_service, file_id: str, content: bytes) -> None:
+    """Store a job's output and mirror it to the direct file (blocking, run in a worker thread)."""
+    with file_storage.lock(file_id):
+        file_storage.update_content(file_id, content)
+
+        # Auto-apply if using direct file mode
+        if direct_service.targets(file_id):
+            direct_service.apply()
+
+
 async def _run_translation_job(
     file_storage,
     job_manager,
     direct_service,
+    service,
     job_id: str,
     file_id: str,
     languages: list[str],
@@ -253,8 +273,7 @@ async def _run_translation_job(
     job_manager.set_running(job_id)
 
     try:
-        content = file_storage.get_content_string(file_id)
-        service = TranslationService()
+        content = await asyncio.to_thread(file_storage.get_content_string, file_id)
 
         async def progress_callback(current, total, message, language, **extra):
             await job_manager.send_progress(
@@ -270,12 +289,9 @@ async def _run_translation_job(
 
         if result.success:
             # Update file with translations
-            file_storage.update_content(file_id, output.encode("utf-8"))
-
-            # Auto-apply if using direct file mode
-            config = direct_service.get_config()
-            if config and config.file_id == file_id:
-                direct_service.apply()
+            await asyncio.to_thread(
+                _store_job_output, file_storage, direct_service, file_id, output.encode("utf-8")
+            )
 
             job_manager.set_completed(job_id, {
                 "languages_processed": result.languages_processed,
@@ -318,7 +334,7 @@ async def get_translation_status(request: Request, job_id: str):
 
 # Review endpoints
 @router.get("/review/{file_id}/{language}")
-async def get_translations_for_review(
+def get_translations_for_review(
     request: Request,
     file_id: str,
     language: str,
@@ -327,13 +343,15 @@ async def get_translations_for_review(
     """Get translations for review."""
     file_storage = request.app.state.file_storage
 
-    content = file_storage.get_content_string(file_id)
-    if not content:
+    service = request.app.state.translation_service
+    translations = file_storage.get_derived(
+        file_id,
+        ("review", language, state),
+        lambda content: service.get_translations_for_review(content, language, state),
+    )
+    if translations is None:
         raise HTTPException(404, "File not found")
 
-    service = TranslationService()
-    translations = service.get_translations_for_review(content, language, state)
-
     return {"language": language, "translations": translations}
 
 
@@ -348,31 +366,26 @@ async def update_translation(
     """Update a single translation."""
     file_storage = request.app.state.file_storage
     review_history = request.app.state.review_history
+    direct_service = request.app.state.direct_file_service
 
-    content = file_storage.get_content_string(file_id)
-    if not content:
-        raise HTTPException(404, "File not found")
-
-    service = TranslationService()
-    updated_content = service.update_translation(
-        content,
+    saved = await asyncio.to_thread(
+        _save_translation,
+        file_storage,
+        direct_service,
+        request.app.state.translation_service,
+        file_id,
         language,
         key,
         body.translation,
         body.state,
     )
+    if not saved:
+        raise HTTPException(404, "File not found")
 
-    file_storage.update_content(file_id, updated_content.encode("utf-8"))
-
-    # Clear review history for this key so it gets re-reviewed
+    # Clear review history for this key so it gets re-reviewed. Kept on the
+    # event loop, since verification jobs update the same history there
     review_history.clear_key(file_id, language, key)
 
-    # Auto-apply if using direct file mode
-    direct_service = request.app.state.direct_file_service
-    config = direct_service.get_config()
-    if config and config.file_id == file_id:
-        direct_service.apply()
-
     return {"status": "updated", "key": key}
 
 
@@ -385,43 +398,33 @@ async def translate_single_string(
 ):
     """Translate a single string and save it."""
     file_storage = request.app.state.file_storage
+    direct_service = request.app.state.direct_file_service
 
-    content = file_storage.get_content_string(file_id)
-    if not content:
+    if not file_storage.exists(file_id):
         raise HTTPException(404, "File not found")
 
-    # Import translator and run in thread pool
-    from ...translation.translator import HybridTranslator
-
-    translator = HybridTranslator()
-
-    result = await asyncio.to_thread(
-        translator.translate,
-        body.key,
-        body.source,
-        language,
-    )
+    # Concurrent single-string requests are sent to the APIs as one batch
+    translate_batcher = request.app.state.translate_batcher
+    result = await translate_batcher.translate(body.key, body.source, language)
 
     if not result.success:
         raise HTTPException(500, f"Translation failed: {result.error or 'Unknown error'}")
 
-    # Save the translation
-    service = TranslationService()
-    updated_content = service.update_translation(
-        content,
+    # Save the translation into the content as it is now, not as it was
+    # before the API call, so edits made meanwhile are kept
+    saved = await asyncio.to_thread(
+        _save_translation,
+        file_storage,
+        direct_service,
+        request.app.state.translation_service,
+        file_id,
         language,
         body.key,
         result.translation,
         "translated",
     )
-
-    file_storage.update_content(file_id, updated_content.encode("utf-8"))
-
-    # Auto-apply if using direct file mode
-    direct_service = request.app.state.direct_file_service
-    config = direct_service.get_config()
-    if config and config.file_id == file_id:
-        direct_service.apply()
+    if not saved:
+        raise HTTPException(404, "File not found")
 
     return {
         "status": "translated",
@@ -433,6 +436,56 @@ async def translate_single_string(
     }
 
 
+def _save_translation(
+    file_storage,
+    direct_service,
+    service,
+    file_id: str,
+    language: str,
+    key: str,
+    translation: str,
+    state: str,
+) -> bool:
+    """Write one translation into a stored file (blocking, run in a worker thread)."""
+    with file_storage.lock(file_id):
+        # The parsed file is kept between edits so a single-key edit does not
+        # re-parse the whole catalog. Unlike other derived values it is
+        # mutated, which is safe because it is only ever used under this lock
+        xcstrings = file_storage.get_derived(file_id, "xcstrings", service.parser.parse_string)
+        if xcstrings is None:
+            return False
+
+        # Stats for the current content, carried over to the edited file below
+        stats = file_storage.get_derived(
+            file_id, "stats", lambda _: service.get_file_stats_from_parsed(xcstrings)
+        )
+        entry = xcstrings.strings.get(key)
+        was_translated = entry is not None and entry.has_translation(language)
+
+        try:
+            updated_content = service.patch_translation(xcstrings, language, key, translation, state)
+            saved = file_storage.update_content(file_id, updated_content)
+        except Exception:
+            # The parsed file may now be ahead of the stored content
+            file_storage.invalidate(file_id)
+            raise
+        if not saved:
+            file_storage.invalidate(file_id)
+            return False
+        file_storage.put_derived(file_id, "xcstrings", xcstrings)
+        file_storage.put_derived(
+            file_id,
+            "stats",
+            service.patch_file_stats(stats, xcstrings, language, key, was_translated),
+        )
+
+        # Auto-apply if using direct file mode
+        if direct_service.targets(file_id):
+            direct_service.apply()
+
+    return True
+
+
 @router.post("/review/{file_id}/{language}/review-single")
 async def review_single_translation(
     request: Request,
@@ -505,6 +558,7 @@ async def translate_all_untranslated(
             file_storage,
             job_manager,
             direct_service,
+            request.app.state.translation_service,
             job.job_id,
             file_id,
             [language],
@@ -540,6 +594,7 @@ async def start_verification(request: Request, file_id: str, body: VerifyRequest
             file_storage,
             job_manager,
             direct_service,
+            request.app.state.translation_service,
             review_history,
             job.job_id,
             file_id,
@@ -556,6 +611,7 @@ async def _run_verification_job(
     file_storage,
     job_manager,
     direct_service,
+    service,
     review_history,
     job_id: str,
     file_id: str,
@@ -567,8 +623,7 @@ async def _run_verification_job(
     job_manager.set_running(job_id)
 
     try:
-        content = file_storage.get_content_string(file_id)
-        service = TranslationService()
+        content = await asyncio.to_thread(file_storage.get_content_string, file_id)
 
         async def progress_callback(current, total, message, lang):
             await job_manager.send_progress(job_id, current, total, message, lang)
@@ -586,12 +641,13 @@ async def _run_verification_job(
         if result.success:
             # Save the updated content (passed strings marked as reviewed)
             if result.auto_reviewed_count > 0:
-                file_storage.update_content(file_id, updated_content.encode("utf-8"))
-
-                # Auto-apply if using direct file mode
-                config = direct_service.get_config()
-                if config and config.file_id == file_id:
-                    direct_service.apply()
+                await asyncio.to_thread(
+                    _store_job_output,
+                    file_storage,
+                    direct_service,
+                    file_id,
+                    updated_content.encode("utf-8"),
+                )
 
             job_manager.set_completed(job_id, {
                 "total_reviewed": result.total_reviewed,
@@ -648,7 +704,7 @@ async def get_verification_status(request: Request, job_id: str):
 
 # Direct file endpoints
 @router.get("/direct/config")
-async def get_direct_config(request: Request):
+def get_direct_config(request: Request):
     """Get current direct file configuration."""
     direct_service = request.app.state.direct_file_service
 
@@ -668,7 +724,7 @@ async def get_direct_config(request: Request):
 
 
 @router.post("/direct/config")
-async def set_direct_config(request: Request, body: DirectFileConfigRequest):
+def set_direct_config(request: Request, body: DirectFileConfigRequest):
     """Configure a direct file path."""
     direct_service = request.app.state.direct_file_service
 
@@ -688,7 +744,7 @@ async def set_direct_config(request: Request, body: DirectFileConfigRequest):
 
 
 @router.delete("/direct/config")
-async def clear_direct_config(request: Request):
+def clear_direct_config(request: Request):
     """Clear direct file configuration."""
     direct_service = request.app.state.direct_file_service
     direct_service.clear_config()
@@ -696,7 +752,7 @@ async def clear_direct_config(request: Request):
 
 
 @router.post("/direct/refresh")
-async def refresh_direct_file(request: Request):
+def refresh_direct_file(request: Request):
     """Refresh content from configured file path."""
     direct_service = request.app.state.direct_file_service
 
@@ -712,7 +768,7 @@ async def refresh_direct_file(request: Request):
 
 
 @router.post("/direct/apply")
-async def apply_direct_file(request: Request):
+def apply_direct_file(request: Request):
     """Apply (save) current content to configured file path."""
     direct_service = request.app.state.direct_file_service
 
@@ -729,28 +785,29 @@ async def apply_direct_file(request: Request):
 
 # Language management endpoints
 @router.post("/languages/{file_id}")
-async def add_language(request: Request, file_id: str, body: AddLanguageRequest):
+def add_language(request: Request, file_id: str, body: AddLanguageRequest):
     """Add a new language to a file."""
     file_storage = request.app.state.file_storage
     direct_service = request.app.state.direct_file_service
 
-    content = file_storage.get_content_string(file_id)
-    if not content:
-        raise HTTPException(404, "File not found")
-
-    service = TranslationService()
+    service = request.app.state.translation_service
 
     try:
-        updated_content = service.add_language(content, body.language)
-        file_storage.update_content(file_id, updated_content.encode("utf-8"))
+        with file_storage.lock(file_id):
+            content = file_storage.get_content_string(file_id)
+            if not content:
+                raise HTTPException(404, "File not found")
+
+            updated_content = service.add_language(content, body.language)
+            file_storage.update_content(file_id, updated_content.encode("utf-8"))
 
-        # Get updated stats
-        stats = service.get_file_stats(updated_content)
+            # Get updated stats, memoized for the polled stats endpoints
+            stats = service.get_file_stats(updated_content)
+            file_storage.put_derived(file_id, "stats", stats)
 
         # Auto-apply if using direct file mode
         applied = False
-        config = direct_service.get_config()
-        if config and config.file_id == file_id:
+        if direct_service.targets(file_id):
             success, message = direct_service.apply()
             applied = success
 
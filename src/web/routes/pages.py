@@ -41,10 +41,8 @@ async def home(request: Request):
         )
 
     # Determine default language (first available or 'de')
-    from ..services.translation_service import TranslationService
-    content = file_storage.get_content_string(config.file_id)
-    service = TranslationService()
-    stats = service.get_file_stats(content)
+    service = request.app.state.translation_service
+    stats = file_storage.get_derived(config.file_id, "stats", service.get_file_stats) or {}
     languages = list(stats.get("coverage", {}).keys())
     language = languages[0] if languages else "de"
 
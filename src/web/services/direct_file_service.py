@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass, asdict
 
+import orjson
+
 from .file_storage import FileStorage
 from ..services.translation_service import TranslationService
 
@@ -30,8 +32,9 @@ class DirectFileConfig:
 class DirectFileService:
     """Manages direct file system access for configured paths."""
 
-    def __init__(self, file_storage: FileStorage):
+    def __init__(self, file_storage: FileStorage, service: Optional[TranslationService] = None):
         self.file_storage = file_storage
+        self.service = service or TranslationService()
         self.config_file = Path(tempfile.gettempdir()) / "localize-web" / "direct_config.json"
         self._config: Optional[DirectFileConfig] = None
         self._load_config()
@@ -88,10 +91,10 @@ class DirectFileService:
 
         # Validate JSON structure
         try:
-            data = json.loads(content)
+            data = orjson.loads(content)
             if "strings" not in data or "sourceLanguage" not in data:
                 raise ValueError("Invalid .xcstrings structure: missing 'strings' or 'sourceLanguage'")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in file: {e}")
 
         # Save to FileStorage
@@ -107,9 +110,9 @@ class DirectFileService:
         )
         self._save_config()
 
-        # Get stats
-        service = TranslationService()
-        stats = service.get_file_stats(content.decode("utf-8"))
+        # Get stats, memoized since the review page asks for them next
+        stats = self.service.get_file_stats(content.decode("utf-8"))
+        self.file_storage.put_derived(metadata.file_id, "stats", stats)
 
         return self._config, stats
 
@@ -117,6 +120,11 @@ class DirectFileService:
         """Get current direct file configuration."""
         return self._config
 
+    def targets(self, file_id: str) -> bool:
+        """Check whether edits to a stored file should be applied to the direct file."""
+        config = self._config
+        return config is not None and config.file_id == file_id
+
     def clear_config(self) -> bool:
         """
         Clear the configured path (switch back to upload mode).
@@ -155,23 +163,21 @@ class DirectFileService:
         except PermissionError:
             return False, f"Permission denied: {self._config.file_path}"
 
-        # Validate JSON
+        # Parsing for the stats also validates the JSON, so the file is parsed once
         try:
-            json.loads(content)
-        except json.JSONDecodeError as e:
+            stats = self.service.get_file_stats(content.decode("utf-8"))
+        except ValueError as e:
             return False, f"Invalid JSON in file: {e}"
 
-        # Update temp storage
-        self.file_storage.update_content(self._config.file_id, content)
+        # Update temp storage; locked so the stats are memoized for this content
+        with self.file_storage.lock(self._config.file_id):
+            self.file_storage.update_content(self._config.file_id, content)
+            self.file_storage.put_derived(self._config.file_id, "stats", stats)
 
         # Update last synced
         self._config.last_synced = datetime.now().isoformat()
         self._save_config()
 
-        # Get stats
-        service = TranslationService()
-        stats = service.get_file_stats(content.decode("utf-8"))
-
         return True, stats
 
     def apply(self) -> tuple[bool, str]:
@@ -193,8 +199,8 @@ class DirectFileService:
 
         # Validate JSON before writing
         try:
-            json.loads(content)
-        except json.JSONDecodeError as e:
+            orjson.loads(content)
+        except orjson.JSONDecodeError as e:
             return False, f"Invalid JSON in storage: {e}"
 
         # Write to file
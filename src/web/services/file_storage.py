@@ -1,12 +1,17 @@
 """File storage service for uploaded .xcstrings files."""
 
 import json
+import os
+import shutil
 import tempfile
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-from dataclasses import dataclass, asdict
+from typing import Any, BinaryIO, Callable, Iterator, Optional
+from dataclasses import dataclass, asdict, replace
+
+from ...cache import LRUMemo
 
 
 @dataclass
@@ -31,6 +36,13 @@ class FileStorage:
     def __init__(self, base_dir: Optional[Path] = None):
         self.base_dir = base_dir or Path(tempfile.gettempdir()) / "localize-web"
         self.base_dir.mkdir(exist_ok=True)
+        # Content version per file, bumped on every write, so values derived
+        # from the content (stats, review listings) can be memoized per version
+        self._versions: dict[str, int] = {}
+        self._derived = LRUMemo(maxsize=32)
+        self._locks: dict[str, threading.Lock] = {}
+        # Parsed metadata per file with the mtime of the .meta file it came from
+        self._metadata: dict[str, tuple[int, FileMetadata]] = {}
 
     def save(self, content: bytes, original_name: str) -> FileMetadata:
         """
@@ -44,20 +56,40 @@ class FileStorage:
             FileMetadata with file_id and other info
         """
         file_id = str(uuid.uuid4())
-        file_path = self._get_file_path(file_id)
-        meta_path = self._get_meta_path(file_id)
 
         # Write file content
-        file_path.write_bytes(content)
+        self._get_file_path(file_id).write_bytes(content)
+
+        return self._save_metadata(file_id, original_name, len(content))
+
+    def save_file(self, fileobj: BinaryIO, original_name: str) -> FileMetadata:
+        """
+        Save an uploaded file by copying it in chunks, without reading it into memory.
+
+        Args:
+            fileobj: Binary file object positioned at the start of the content
+            original_name: Original filename
+
+        Returns:
+            FileMetadata with file_id and other info
+        """
+        file_id = str(uuid.uuid4())
 
-        # Create and save metadata
+        with open(self._get_file_path(file_id), "wb") as f:
+            shutil.copyfileobj(fileobj, f, 1 << 16)
+            size = f.tell()
+
+        return self._save_metadata(file_id, original_name, size)
+
+    def _save_metadata(self, file_id: str, original_name: str, size_bytes: int) -> FileMetadata:
+        """Create and save the metadata of a newly stored file."""
         metadata = FileMetadata(
             file_id=file_id,
             original_name=original_name,
             upload_time=datetime.now().isoformat(),
-            size_bytes=len(content),
+            size_bytes=size_bytes,
         )
-        meta_path.write_text(json.dumps(metadata.to_dict()))
+        self._get_meta_path(file_id).write_text(json.dumps(metadata.to_dict()))
 
         return metadata
 
@@ -68,6 +100,49 @@ class FileStorage:
             return None
         return file_path.read_bytes()
 
+    def iter_content(self, file_id: str, chunk_size: int = 65536) -> Optional[Iterator[bytes]]:
+        """
+        Stream file content in chunks instead of reading it all into memory.
+
+        The file is opened before returning, so every chunk comes from the same
+        version even if an edit replaces the file while it is being read.
+
+        Args:
+            file_id: File ID
+            chunk_size: Bytes per chunk
+
+        Returns:
+            Iterator over the content's chunks, or None if the file does not exist
+        """
+        try:
+            f = self._get_file_path(file_id).open("rb")
+        except FileNotFoundError:
+            return None
+        return self._iter_chunks(f, chunk_size)
+
+    @staticmethod
+    def _iter_chunks(f: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+        """Yield chunks from an open file, closing it when done."""
+        with f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+    def get_etag(self, file_id: str) -> Optional[str]:
+        """
+        Get an ETag for the file's current content without reading it.
+
+        Every write replaces the file, so its inode, mtime and size together
+        change whenever the content does.
+
+        Returns:
+            Quoted ETag, or None if the file does not exist
+        """
+        try:
+            stat = self._get_file_path(file_id).stat()
+        except FileNotFoundError:
+            return None
+        return f'"{stat.st_ino:x}-{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
     def get_content_string(self, file_id: str) -> Optional[str]:
         """Get file content as string by ID."""
         content = self.get_content(file_id)
@@ -76,26 +151,49 @@ class FileStorage:
         return content.decode("utf-8")
 
     def get_metadata(self, file_id: str) -> Optional[FileMetadata]:
-        """Get file metadata by ID."""
+        """
+        Get file metadata by ID.
+
+        Every page and most API calls look up metadata, so it is parsed once
+        and reused until the .meta file's mtime changes; a hit costs a single
+        stat. The returned object is shared, so callers must not mutate it.
+        """
         meta_path = self._get_meta_path(file_id)
-        if not meta_path.exists():
+        try:
+            mtime_ns = meta_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._metadata.pop(file_id, None)
             return None
-        data = json.loads(meta_path.read_text())
-        return FileMetadata.from_dict(data)
+
+        cached = self._metadata.get(file_id)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+        metadata = FileMetadata.from_dict(json.loads(meta_path.read_text()))
+        self._metadata[file_id] = (mtime_ns, metadata)
+        return metadata
 
     def update_content(self, file_id: str, content: bytes) -> bool:
         """Update file content."""
         file_path = self._get_file_path(file_id)
         if not file_path.exists():
             return False
-        file_path.write_bytes(content)
+        # Written to a temp file and renamed into place, so readers in other
+        # threads never see a partially written file
+        tmp_path = file_path.with_name(f"{file_path.name}.tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, file_path)
+        # Bumped only after the write, so nothing computed from the old
+        # content can be memoized under the new version
+        self._bump_version(file_id)
 
         # Update size in metadata
         meta = self.get_metadata(file_id)
         if meta:
-            meta.size_bytes = len(content)
+            meta = replace(meta, size_bytes=len(content))
             meta_path = self._get_meta_path(file_id)
             meta_path.write_text(json.dumps(meta.to_dict()))
+            self._metadata.pop(file_id, None)
 
         return True
 
@@ -112,8 +210,63 @@ class FileStorage:
             meta_path.unlink()
             deleted = True
 
+        self._metadata.pop(file_id, None)
+        self._bump_version(file_id)
         return deleted
 
+    def lock(self, file_id: str) -> threading.Lock:
+        """
+        Get the lock serializing read-modify-write updates of a file.
+
+        Request handlers run in a thread pool, so two edits of the same file
+        could otherwise both read the old content and one would be lost.
+        """
+        return self._locks.setdefault(file_id, threading.Lock())
+
+    def get_version(self, file_id: str) -> int:
+        """Get the file's content version (changes whenever the content does)."""
+        return self._versions.get(file_id, 0)
+
+    def get_derived(
+        self, file_id: str, name: Any, compute: Callable[[str], Any]
+    ) -> Optional[Any]:
+        """
+        Get a value derived from the file content, computing it once per version.
+
+        Polled endpoints (stats, review listings) would otherwise re-read and
+        re-parse the whole file on every request. Memoized values are shared,
+        so callers must not mutate them.
+
+        Args:
+            file_id: File ID
+            name: Hashable name of the derived value, including its arguments
+            compute: Function computing the value from the content string
+
+        Returns:
+            The derived value, or None if the file does not exist
+        """
+        key = (file_id, self.get_version(file_id), name)
+        value = self._derived.get(key)
+        if value is None:
+            content = self.get_content_string(file_id)
+            if content is None:
+                return None
+            value = compute(content)
+            self._derived.put(key, value)
+        return value
+
+    def put_derived(self, file_id: str, name: Any, value: Any) -> None:
+        """Memoize a value already derived from the file's current content (see get_derived())."""
+        self._derived.put((file_id, self.get_version(file_id), name), value)
+
+    def invalidate(self, file_id: str) -> None:
+        """Drop every value derived from the file, e.g. after a failed edit."""
+        self._bump_version(file_id)
+
+    def _bump_version(self, file_id: str) -> None:
+        """Mark the file's content as changed."""
+        self._versions[file_id] = self.get_version(file_id) + 1
+
     def list_files(self) -> list[FileMetadata]:
         """List all stored files."""
         files = []
@@ -6,7 +6,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Optional, AsyncGenerator
-import json
+
+import orjson
 
 
 class JobStatus(str, Enum):
@@ -146,7 +147,7 @@ class JobManager:
         Yields SSE-formatted strings.
         """
         if job_id not in self.queues:
-            yield f"data: {json.dumps({'error': 'Job not found'})}\n\n"
+            yield f"data: {orjson.dumps({'error': 'Job not found'}).decode('utf-8')}\n\n"
             return
 
         queue = self.queues[job_id]
@@ -158,12 +159,12 @@ class JobManager:
                 # Check for completion or error
                 if isinstance(data, dict):
                     if data.get("complete"):
-                        yield f"event: complete\ndata: {json.dumps(data)}\n\n"
+                        yield f"event: complete\ndata: {orjson.dumps(data).decode('utf-8')}\n\n"
                         break
                     if data.get("error"):
-                        yield f"event: error\ndata: {json.dumps(data)}\n\n"
+                        yield f"event: error\ndata: {orjson.dumps(data).decode('utf-8')}\n\n"
                         break
-                    yield f"data: {json.dumps(data)}\n\n"
+                    yield f"data: {orjson.dumps(data).decode('utf-8')}\n\n"
                 elif isinstance(data, JobProgress):
                     event_data = {
                         "current": data.current,
@@ -173,7 +174,7 @@ class JobManager:
                         "language": data.language,
                         **data.extra,
                     }
-                    yield f"event: progress\ndata: {json.dumps(event_data)}\n\n"
+                    yield f"event: progress\ndata: {orjson.dumps(event_data).decode('utf-8')}\n\n"
 
             except asyncio.TimeoutError:
                 # Send heartbeat to keep connection alive
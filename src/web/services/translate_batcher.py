@@ -0,0 +1,102 @@
+"""Batcher that coalesces concurrent single-string translation requests."""
+
+import asyncio
+from dataclasses import replace
+from typing import Optional
+
+from ...models.translation_result import TranslationResult
+from ...translation.translator import HybridTranslator
+
+
+class TranslateBatcher:
+    """
+    Coalesces concurrent single-string translations into batched API calls.
+
+    Requests for the same language that arrive within max_delay of each
+    other (up to max_batch of them) are sent as one
+    HybridTranslator.atranslate_batch() call, so N strings translated at
+    once cost about one round trip instead of N.
+    """
+
+    def __init__(self, max_batch: int = 32, max_delay: float = 0.05):
+        """
+        Initialize the batcher.
+
+        Args:
+            max_batch: Flush a language's batch as soon as it holds this many strings
+            max_delay: Seconds to wait for more strings before flushing a batch
+        """
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._pending: dict[str, list[tuple[str, str, asyncio.Future]]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._translator: Optional[HybridTranslator] = None
+
+    def _get_translator(self) -> HybridTranslator:
+        """
+        Get the translator shared by every batch, creating it on first use.
+
+        Reusing one keeps its provider semaphores bounding concurrent batches
+        together, and its clients' connections and quota tracking warm.
+        """
+        if self._translator is None:
+            self._translator = HybridTranslator()
+        return self._translator
+
+    async def translate(self, key: str, source: str, language: str) -> TranslationResult:
+        """
+        Translate a single string as part of the next batch for its language.
+
+        Args:
+            key: The string key
+            source: Source text to translate
+            language: Target language code
+
+        Returns:
+            TranslationResult for this string
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        batch = self._pending.setdefault(language, [])
+        batch.append((key, source, future))
+        if len(batch) >= self.max_batch:
+            self._flush(language)
+        elif language not in self._timers:
+            self._timers[language] = loop.call_later(self.max_delay, self._flush, language)
+
+        return await future
+
+    def _flush(self, language: str) -> None:
+        """Send a language's pending strings as one batch."""
+        timer: Optional[asyncio.TimerHandle] = self._timers.pop(language, None)
+        if timer:
+            timer.cancel()
+
+        batch = self._pending.pop(language, [])
+        if batch:
+            # Keep a reference so the task is not garbage collected mid-flight
+            task = asyncio.create_task(self._run(language, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self, language: str, batch: list[tuple[str, str, asyncio.Future]]
+    ) -> None:
+        """Translate one batch and resolve each request's future."""
+        # Indexed by position, since concurrent requests may share a key
+        strings = {i: source for i, (_, source, _) in enumerate(batch)}
+
+        try:
+            results, _ = await self._get_translator().atranslate_batch(strings, language)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (key, _, future), result in zip(batch, results):
+            # The request may have been cancelled (client disconnected)
+            if not future.done():
+                future.set_result(replace(result, key=key))
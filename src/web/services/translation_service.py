@@ -1,11 +1,13 @@
 """Translation service that adapts CLI translation logic for web use."""
 
 import asyncio
+from pathlib import Path
 from typing import Callable, Optional
 from dataclasses import dataclass, asdict
 
 from ...extraction.xcstrings_parser import XCStringsParser
 from ...extraction.xcstrings_writer import XCStringsWriter
+from ...models.string_entry import XCStringsFile
 from ...translation.translator import HybridTranslator, TranslationStats
 from ...validation.llm_reviewer import LLMReviewer, BulkReviewResult
 from ...config import config
@@ -45,7 +47,8 @@ class TranslationService:
     """
     Adapts CLI translation logic for web use.
 
-    Provides async wrappers around synchronous translation code.
+    Provides async wrappers around synchronous translation code. Holds no
+    per-request state, so the app shares one instance across all requests.
     """
 
     def __init__(self):
@@ -78,76 +81,79 @@ class TranslationService:
 
             stats_by_language = {}
             total_languages = len(languages)
+            completed = 0
 
-            for lang_idx, lang in enumerate(languages):
-                # Get strings that need translation for this language
+            # Get strings that need translation for each language
+            pending = {}
+            for lang in languages:
+                translated_keys = xcstrings.get_translated_keys(lang)
                 strings_to_translate = {
                     k: v for k, v in all_strings.items()
-                    if k in xcstrings.strings and not xcstrings.strings[k].has_translation(lang)
+                    if k not in translated_keys
                 }
 
                 if not strings_to_translate:
+                    completed += 1
                     if progress_callback:
                         await progress_callback(
-                            lang_idx + 1,
+                            completed,
                             total_languages,
                             f"All strings already translated for {lang}",
                             lang,
                             skipped=True,
                         )
                     continue
+                pending[lang] = strings_to_translate
 
-                # Create translator
-                translator = HybridTranslator(quality_threshold=quality_threshold)
+            # One translator for every language, so its per-provider
+            # semaphores bound the combined load of the concurrent languages
+            translator = HybridTranslator(quality_threshold=quality_threshold)
 
-                # Create a sync progress callback that queues updates
-                progress_queue = asyncio.Queue()
+            # Sync progress callbacks and finished languages feed one queue
+            progress_queue = asyncio.Queue()
 
+            def sync_progress_for(lang: str) -> Callable[[int, int, str], None]:
+                """Build a sync callback that puts a language's updates in the queue."""
                 def sync_progress(current: int, total: int, message: str):
-                    """Sync callback that puts updates in queue."""
-                    try:
-                        loop = asyncio.get_event_loop()
-                        if loop.is_running():
-                            asyncio.run_coroutine_threadsafe(
-                                progress_queue.put((current, total, message)),
-                                loop
-                            )
-                    except Exception:
-                        pass
-
-                # Run translation in thread pool
-                async def run_translation():
-                    return await asyncio.to_thread(
-                        translator.translate_batch,
-                        strings_to_translate,
-                        lang,
-                        None,  # context
-                        sync_progress,
-                    )
+                    progress_queue.put_nowait((lang, current, total, message, None))
+                return sync_progress
+
+            async def translate_language(lang: str) -> None:
+                """Translate one language and queue its results."""
+                outcome = await translator.atranslate_batch(
+                    pending[lang],
+                    lang,
+                    None,  # context
+                    sync_progress_for(lang),
+                )
+                progress_queue.put_nowait((lang, None, None, None, outcome))
 
-                # Start translation task
-                translation_task = asyncio.create_task(run_translation())
+            # Translate all languages concurrently (runs on this event loop)
+            tasks = [asyncio.create_task(translate_language(lang)) for lang in pending]
+            translation_task = asyncio.gather(*tasks)
 
-                # Process progress updates while translation runs
-                while not translation_task.done():
-                    try:
-                        current, total, message = await asyncio.wait_for(
-                            progress_queue.get(),
-                            timeout=0.5
+            # Process progress updates while translation runs
+            while not (translation_task.done() and progress_queue.empty()):
+                try:
+                    lang, current, total, message, outcome = await asyncio.wait_for(
+                        progress_queue.get(),
+                        timeout=0.5
+                    )
+                except asyncio.TimeoutError:
+                    continue
+
+                if outcome is None:
+                    if progress_callback:
+                        await progress_callback(
+                            current,
+                            total,
+                            message,
+                            lang,
+                            lang_progress=current / total if total > 0 else 0,
                         )
-                        if progress_callback:
-                            await progress_callback(
-                                current,
-                                total,
-                                message,
-                                lang,
-                                lang_progress=current / total if total > 0 else 0,
-                            )
-                    except asyncio.TimeoutError:
-                        continue
+                    continue
 
-                # Get results
-                results, stats = await translation_task
+                results, stats = outcome
 
                 # Update xcstrings with translations
                 for result in results:
@@ -165,15 +171,29 @@ class TranslationService:
                     "red_count": stats.red_count,
                 }
 
+                completed += 1
                 if progress_callback:
                     await progress_callback(
-                        lang_idx + 1,
+                        completed,
                         total_languages,
                         f"Completed {lang}",
                         lang,
                         stats=stats_by_language[lang],
                     )
 
+            try:
+                await translation_task
+            except Exception:
+                # Stop the other languages instead of leaving them running
+                for task in tasks:
+                    task.cancel()
+                raise
+
+            # Report languages in the order they were requested
+            stats_by_language = {
+                lang: stats_by_language[lang] for lang in languages if lang in stats_by_language
+            }
+
             # Convert back to JSON
             output = self.writer.to_string(xcstrings)
 
@@ -424,8 +444,38 @@ class TranslationService:
 
     def get_file_stats(self, file_content: str) -> dict:
         """Get statistics for an xcstrings file."""
-        xcstrings = self.parser.parse_string(file_content)
+        return self.get_file_stats_from_parsed(self.parser.parse_string(file_content))
+
+    def get_file_stats_for_path(self, path: Path) -> dict:
+        """
+        Get statistics for an xcstrings file on disk, validating it in the same pass.
+
+        With the streaming extra (ijson) installed the file is parsed
+        incrementally, so a large upload is never held in memory as raw bytes
+        plus a full JSON tree; otherwise it is parsed in one go with orjson.
 
+        Args:
+            path: Path to the .xcstrings file
+
+        Returns:
+            Statistics dict, as from get_file_stats()
+
+        Raises:
+            ValueError: If the file is not valid JSON
+        """
+        try:
+            import ijson
+        except ImportError:
+            return self.get_file_stats_from_parsed(self.parser.parse(str(path)))
+
+        try:
+            xcstrings = self.parser.parse_streaming(str(path))
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON: {e}") from e
+        return self.get_file_stats_from_parsed(xcstrings)
+
+    def get_file_stats_from_parsed(self, xcstrings: XCStringsFile) -> dict:
+        """Get statistics for an already parsed xcstrings file."""
         total = len(xcstrings.strings)
         translatable = xcstrings.get_translatable_strings()
 
@@ -536,6 +586,87 @@ class TranslationService:
 
         return self.writer.to_string(xcstrings)
 
+    def patch_translation(
+        self,
+        xcstrings: XCStringsFile,
+        language: str,
+        key: str,
+        new_translation: str,
+        new_state: str = "translated",
+    ) -> bytes:
+        """
+        Update a single translation of an already parsed file in place.
+
+        Lets callers that keep the parsed file between edits skip re-parsing
+        the whole catalog for every single-key change.
+
+        Args:
+            xcstrings: Parsed file, modified in place
+            language: Target language code
+            key: String key
+            new_translation: New translation value
+            new_state: New translation state
+
+        Returns:
+            Updated file content as UTF-8 JSON
+        """
+        if key in xcstrings.strings:
+            xcstrings.set_translation(key, language, new_translation, new_state)
+
+        return self.writer.to_bytes(xcstrings)
+
+    def patch_file_stats(
+        self,
+        stats: dict,
+        xcstrings: XCStringsFile,
+        language: str,
+        key: str,
+        was_translated: bool,
+    ) -> dict:
+        """
+        Update file statistics for a single-key edit made by patch_translation().
+
+        Only the edited language's coverage can change, so it is moved by the
+        one entry's transition instead of recounting the whole file. Edits the
+        counters cannot express (source text, a language new to the file) fall
+        back to recomputing from the parsed file.
+
+        Args:
+            stats: Statistics for the file before the edit (not modified)
+            xcstrings: Parsed file after the edit
+            language: Edited language code
+            key: Edited string key
+            was_translated: Whether the entry had a translation before the edit
+
+        Returns:
+            Statistics for the edited file
+        """
+        entry = xcstrings.strings.get(key)
+        if entry is None:
+            return stats
+
+        coverage = stats["coverage"].get(language)
+        if coverage is None or language == xcstrings.source_language:
+            return self.get_file_stats_from_parsed(xcstrings)
+
+        delta = entry.has_translation(language) - was_translated
+        if not delta:
+            return stats
+
+        translated = coverage["translated"] + delta
+        total = coverage["total"]
+        return {
+            **stats,
+            "coverage": {
+                **stats["coverage"],
+                language: {
+                    "translated": translated,
+                    "total": total,
+                    "percentage": round((translated / total) * 100, 1) if total else 0,
+                },
+            },
+        }
+
     def get_untranslated_keys(self, file_content: str, language: str) -> list[dict]:
         """Get untranslated strings for a language."""
         xcstrings = self.parser.parse_string(file_content)